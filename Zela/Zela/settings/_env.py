@@ -0,0 +1,56 @@
+"""
+Environment helpers shared by the Zela settings modules.
+"""
+
+from functools import lru_cache
+from decouple import config, undefined
+from django.utils.functional import SimpleLazyObject
+
+
+@lru_cache(maxsize=None)
+def env(key, default=undefined, cast=undefined):
+    """Read and cast an environment variable once per process."""
+    return config(key, default=default, cast=cast)
+
+
+def env_csv(key, default=''):
+    """Parse a comma-separated environment variable into a tuple, dropping blanks."""
+    return tuple(filter(None, (item.strip() for item in env(key, default=default).split(','))))
+
+
+def order_hosts(hosts):
+    """Deduplicate ``hosts`` and list exact names ahead of wildcard patterns.
+
+    Django's host validation scans ALLOWED_HOSTS in order, so exact names
+    (the common case) should be tried before any ``.domain`` pattern.
+    """
+    hosts = tuple(dict.fromkeys(hosts))
+    exact = frozenset(host for host in hosts if not host.startswith('.') and '*' not in host)
+    return tuple(host for host in hosts if host in exact) + tuple(host for host in hosts if host not in exact)
+
+
+def env_database(key='DATABASE_URL', conn_max_age=600):
+    """Return database settings for ``key``, importing dj_database_url on first use.
+
+    Connections are kept open for ``conn_max_age`` seconds and health-checked
+    before reuse, so the sync gunicorn workers skip the connect/auth handshake
+    on most requests. Don't combine this with gevent/eventlet workers: every
+    greenlet would hold its own idle connection.
+
+    Set ``DATABASE_TRANSACTION_POOLING`` when ``key`` points at a PgBouncer
+    running in transaction pooling mode. The pooler then owns the server
+    connections, so Django closes its own after each request and stops using
+    server-side cursors, which can't outlive a pooled transaction.
+    """
+    def _build():
+        import dj_database_url
+        pooled = env('DATABASE_TRANSACTION_POOLING', default=False, cast=bool)
+        database = dj_database_url.config(
+            default=env(key, default=''),
+            conn_max_age=0 if pooled else conn_max_age,
+            conn_health_checks=not pooled,
+        )
+        if pooled:
+            database['DISABLE_SERVER_SIDE_CURSORS'] = True
+        return database
+    return SimpleLazyObject(_build)
@@ -0,0 +1,102 @@
+"""
+Logging configuration for deployed Zela environments.
+
+Settings modules point LOGGING_CONFIG at configure() and set LOGGING to
+{'environment': <name>}; the full dictConfig structure is only built when
+Django configures logging.
+"""
+
+import logging.config
+from ._env import env
+
+
+def production():
+    """Logging for the Azure production deployment."""
+    return {
+        'version': 1,
+        'disable_existing_loggers': False,
+        'formatters': {
+            'verbose': {
+                'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
+                'style': '{',
+            },
+        },
+        'handlers': {
+            'console': {
+                'class': 'logging.StreamHandler',
+                'formatter': 'verbose',
+            },
+        },
+        'root': {
+            'handlers': ['console'],
+            'level': 'INFO',
+        },
+        'loggers': {
+            'django': {
+                'handlers': ['console'],
+                'level': 'INFO',
+                'propagate': False,
+            },
+            'django.db.backends': {
+                'handlers': ['console'],
+                'level': 'WARNING',
+                'propagate': False,
+            },
+            'django.request': {
+                'handlers': ['console'],
+                'level': 'ERROR',
+                'propagate': False,
+            },
+        },
+    }
+
+
+def staging():
+    """Logging for the Render staging deployment."""
+    return {
+        'version': 1,
+        'disable_existing_loggers': False,
+        'formatters': {
+            'verbose': {
+                'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
+                'style': '{',
+            },
+            'simple': {
+                'format': '{levelname} {message}',
+                'style': '{',
+            },
+        },
+        'handlers': {
+            'console': {
+                'class': 'logging.StreamHandler',
+                'formatter': 'verbose',
+            },
+        },
+        'root': {
+            'handlers': ['console'],
+            'level': env('LOG_LEVEL', default='INFO'),
+        },
+        'loggers': {
+            'django': {
+                'handlers': ['console'],
+                'level': env('DJANGO_LOG_LEVEL', default='INFO'),
+                'propagate': False,
+            },
+            'Zela': {  # Your app-specific logging
+                'handlers': ['console'],
+                'level': env('APP_LOG_LEVEL', default='DEBUG'),
+                'propagate': False,
+            },
+        },
+    }
+
+
+BUILDERS = {
+    'production': production,
+    'staging': staging,
+}
+
+
+def configure(logging_settings):
+    """LOGGING_CONFIG callable: build and apply the named environment's config."""
+    logging.config.dictConfig(BUILDERS[logging_settings['environment']]())
@@ -39,5 +39,10 @@ EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 # Disable SSL redirects in development
 SECURE_SSL_REDIRECT = False
 
-# Static files - disable compression in development
-STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage' 
\ No newline at end of file
+# Static files - disable compression and hashing in development
+STORAGES = {
+    **STORAGES,
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+} 
\ No newline at end of file
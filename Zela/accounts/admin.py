@@ -1,11 +1,122 @@
+from types import MappingProxyType
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from django.utils.html import format_html
+from django.db import transaction
+from django.db.models import Case, CharField, Func, IntegerField, Max, Value, When
+from django.db.models.functions import Cast, Coalesce, Concat, LPad, Mod, NullIf, Trim
+from django.utils import timezone
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
 from .models import User, ProviderProfile, Profile, PaymentMethod, Location, DistanceRequest, ProviderDocument, ProviderContract, UserSettings
+from .changelists import ColumnLimitedChangeList
+from .paginators import EstimatedCountPaginator
 
+# Star strings for whole-number ratings 0-5, indexed by rating
+_STARS = tuple("★" * i + "☆" * (5 - i) for i in range(6))
 
-@admin.register(User)
-class UserAdmin(BaseUserAdmin):
+# Masked card number prefix; the last four digits are appended
+_CARD_MASK = '•••• •••• •••• '
+
+# Card brand -> icon shown in the payment method changelist
+_BRAND_ICONS = MappingProxyType({
+    'visa': '💳',
+    'mastercard': '💳',
+    'amex': '💳',
+    'discover': '💳',
+})
+
+# Zela-specific user fields appended to the stock auth admin fieldsets
+_EXTRA_FIELDSET = (
+    ('Additional Info', {
+        'fields': ('role', 'phone', 'locale'),
+    }),
+)
+
+
+class JSONArrayLength(Func):
+    """Length of a JSON array column, computed by the database.
+
+    Non-array values count as 0: SQLite's JSON_ARRAY_LENGTH already does
+    that, while PostgreSQL's JSONB_ARRAY_LENGTH raises, so it is guarded.
+    """
+    
+    function = 'JSON_ARRAY_LENGTH'
+    output_field = IntegerField()
+    
+    def as_postgresql(self, compiler, connection, **extra_context):
+        sql, params = super().as_sql(compiler, connection, template='%(expressions)s', **extra_context)
+        return (
+            f"CASE WHEN JSONB_TYPEOF({sql}) = 'array' THEN JSONB_ARRAY_LENGTH({sql}) ELSE 0 END",
+            (*params, *params),
+        )
+
+
+def _display_name(prefix='user__'):
+    """Database expression equivalent to ``user.get_full_name() or user.username``."""
+    return Coalesce(
+        NullIf(Trim(Concat(f'{prefix}first_name', Value(' '), f'{prefix}last_name')), Value('')),
+        f'{prefix}username',
+    )
+
+
+class _ChangelistMixin:
+    """Changelist defaults for large tables: estimated counts and smaller pages.
+    
+    Set ``list_only_fields`` to the columns ``list_display`` needs (including
+    ``list_select_related`` paths) to keep wide rows out of the changelist
+    query; change forms still load every column.
+    """
+    
+    paginator = EstimatedCountPaginator
+    list_per_page = 50
+    show_full_result_count = False
+    list_only_fields = None
+    
+    def get_changelist(self, request, **kwargs):
+        return ColumnLimitedChangeList
+
+
+class _UserDisplayMixin:
+    """Shared ``user_display`` changelist column for admins of user-owned records."""
+    
+    _USE_FULL_NAME = True
+    
+    def get_queryset(self, request):
+        """Annotate display names in the database."""
+        queryset = super().get_queryset(request)
+        if self._USE_FULL_NAME:
+            queryset = queryset.annotate(_display_name=_display_name())
+        return queryset
+    
+    def user_display(self, obj):
+        """Display user with name (or username) and email."""
+        name = obj._display_name if self._USE_FULL_NAME else obj.user.username
+        return mark_safe(f'<strong>{escape(name)}</strong><br><small>{escape(obj.user.email)}</small>')
+    user_display.short_description = 'User'
+
+
+class _ProviderDisplayMixin:
+    """Shared changelist column for admins of provider-owned records.
+    
+    The ``_provider_name`` annotation only feeds ``provider_display``; the
+    records' ``__str__`` (used for the action checkbox label) still reads the
+    provider user's name columns, so ``list_only_fields`` must keep them.
+    """
+    
+    def get_queryset(self, request):
+        """Annotate provider display names in the database."""
+        return super().get_queryset(request).annotate(
+            _provider_name=_display_name('provider__user__')
+        )
+    
+    def provider_display(self, obj):
+        """Display provider with name."""
+        name = escape(obj._provider_name)
+        return mark_safe(f'<strong>{name}</strong><br><small>{escape(obj.provider.user.email)}</small>')
+    provider_display.short_description = 'Provider'
+
+
+class UserAdmin(_ChangelistMixin, BaseUserAdmin):
     """Custom user admin with role-based organization."""
     
     list_display = ('username', 'email', 'first_name', 'last_name', 'role', 'is_active', 'date_joined')
@@ -13,25 +124,11 @@ class UserAdmin(BaseUserAdmin):
     search_fields = ('username', 'email', 'first_name', 'last_name', 'phone')
     ordering = ('-date_joined',)
     
-    fieldsets = BaseUserAdmin.fieldsets + (
-        ('Additional Info', {
-            'fields': ('role', 'phone', 'locale'),
-        }),
-    )
-    
-    add_fieldsets = BaseUserAdmin.add_fieldsets + (
-        ('Additional Info', {
-            'fields': ('role', 'phone', 'locale'),
-        }),
-    )
-    
-    def get_queryset(self, request):
-        """Optimize query with related objects."""
-        return super().get_queryset(request).select_related()
+    fieldsets = BaseUserAdmin.fieldsets + _EXTRA_FIELDSET
+    add_fieldsets = BaseUserAdmin.add_fieldsets + _EXTRA_FIELDSET
 
 
-@admin.register(ProviderProfile)
-class ProviderProfileAdmin(admin.ModelAdmin):
+class ProviderProfileAdmin(_UserDisplayMixin, _ChangelistMixin, admin.ModelAdmin):
     """Provider profile admin."""
     
     list_display = (
@@ -50,6 +147,14 @@ class ProviderProfileAdmin(admin.ModelAdmin):
         'total_earnings', 'jobs_completed', 'jobs_total', 'completion_rate'
     )
     ordering = ('-created_at',)
+    list_select_related = ('user',)
+    autocomplete_fields = ('user',)
+    list_only_fields = (
+        'user__username', 'user__first_name', 'user__last_name', 'user__email',
+        'service_area', 'is_approved', 'is_available',
+        'rating_average', 'rating_count', 'completion_rate', 'total_earnings',
+        'created_at'
+    )
     
     fieldsets = (
         ('Provider Information', {
@@ -86,12 +191,8 @@ class ProviderProfileAdmin(admin.ModelAdmin):
     )
     
     def user_display(self, obj):
-        """Display user with name and email."""
-        name = obj.user.get_full_name() or obj.user.username
-        return format_html(
-            '<strong>{}</strong><br><small>{}</small>',
-            name, obj.user.email
-        )
+        """Display provider with name and email."""
+        return super().user_display(obj)
     user_display.short_description = 'Provider'
     
     def rating_display(self, obj):
@@ -99,26 +200,30 @@ class ProviderProfileAdmin(admin.ModelAdmin):
         if obj.rating_count == 0:
             return "No ratings"
         
-        stars = "★" * int(obj.rating_average) + "☆" * (5 - int(obj.rating_average))
-        return format_html(
-            '{} <small>({} avg, {} reviews)</small>',
-            stars, f'{obj.rating_average:.1f}', obj.rating_count
-        )
+        stars = _STARS[min(5, int(obj.rating_average))]
+        return mark_safe(f'{stars} <small>({obj.rating_average:.1f} avg, {obj.rating_count} reviews)</small>')
     rating_display.short_description = 'Rating'
     
+    def get_queryset(self, request):
+        """Annotate skill counts in the database."""
+        return super().get_queryset(request).annotate(
+            _skills_count=Coalesce(JSONArrayLength('skills'), Value(0))
+        )
+    
     def skills_count(self, obj):
         """Display number of skills."""
-        return len(obj.skills) if obj.skills else 0
+        return obj._skills_count
     skills_count.short_description = 'Skills'
+    skills_count.admin_order_field = '_skills_count'
     
     def completion_rate_display(self, obj):
         """Display completion rate."""
-        return format_html('{}%', f'{obj.completion_rate:.1f}')
+        return f'{obj.completion_rate:.1f}%'
     completion_rate_display.short_description = 'Completion Rate'
     
     def total_earnings_display(self, obj):
         """Display total earnings with currency."""
-        return format_html('Kz {}', f'{obj.total_earnings:,.2f}')
+        return f'Kz {obj.total_earnings:,.2f}'
     total_earnings_display.short_description = 'Total Earnings'
     
     actions = ['approve_providers', 'reject_providers']
@@ -136,10 +241,11 @@ class ProviderProfileAdmin(admin.ModelAdmin):
     reject_providers.short_description = 'Reject selected providers'
 
 
-@admin.register(Profile)
-class ProfileAdmin(admin.ModelAdmin):
+class ProfileAdmin(_UserDisplayMixin, _ChangelistMixin, admin.ModelAdmin):
     """User profile admin."""
     
+    _USE_FULL_NAME = False
+    
     list_display = (
         'user_display', 'has_profile_picture', 'full_name', 
         'email_notifications', 'sms_notifications', 'newsletter', 
@@ -147,13 +253,15 @@ class ProfileAdmin(admin.ModelAdmin):
     )
     list_filter = ('email_notifications', 'sms_notifications', 'newsletter', 
                    'marketing_communications', 'created_at', 'updated_at')
-    search_fields = ('user__username', 'user__email', 'first_name', 'last_name')
+    search_fields = ('user__username', 'user__email', 'user__first_name', 'user__last_name')
     readonly_fields = ('created_at', 'updated_at')
     ordering = ('-created_at',)
+    list_select_related = ('user',)
+    autocomplete_fields = ('user',)
     
     fieldsets = (
         ('User Information', {
-            'fields': ('user', 'first_name', 'last_name'),
+            'fields': ('user',),
         }),
         ('Profile Picture', {
             'fields': ('profile_picture',),
@@ -169,14 +277,6 @@ class ProfileAdmin(admin.ModelAdmin):
         }),
     )
     
-    def user_display(self, obj):
-        """Display user with username and email."""
-        return format_html(
-            '<strong>{}</strong><br><small>{}</small>',
-            obj.user.username, obj.user.email
-        )
-    user_display.short_description = 'User'
-    
     def has_profile_picture(self, obj):
         """Check if profile has a picture."""
         return bool(obj.profile_picture)
@@ -184,17 +284,12 @@ class ProfileAdmin(admin.ModelAdmin):
     has_profile_picture.short_description = 'Has Picture'
     
     def full_name(self, obj):
-        """Display full name from profile or user."""
-        first = obj.first_name or obj.user.first_name
-        last = obj.last_name or obj.user.last_name
-        if first or last:
-            return f"{first} {last}".strip()
-        return "-"
+        """Display the user's full name."""
+        return obj.user.get_full_name() or "-"
     full_name.short_description = 'Full Name'
 
 
-@admin.register(PaymentMethod)
-class PaymentMethodAdmin(admin.ModelAdmin):
+class PaymentMethodAdmin(_UserDisplayMixin, _ChangelistMixin, admin.ModelAdmin):
     """Payment method admin."""
     
     list_display = (
@@ -206,6 +301,8 @@ class PaymentMethodAdmin(admin.ModelAdmin):
                      'user__last_name', 'last4', 'provider_id')
     readonly_fields = ('added_at',)
     ordering = ('-added_at',)
+    list_select_related = ('user',)
+    autocomplete_fields = ('user',)
     
     fieldsets = (
         ('User Information', {
@@ -224,50 +321,46 @@ class PaymentMethodAdmin(admin.ModelAdmin):
         }),
     )
     
-    def user_display(self, obj):
-        """Display user with name and email."""
-        name = obj.user.get_full_name() or obj.user.username
-        return format_html(
-            '<strong>{}</strong><br><small>{}</small>',
-            name, obj.user.email
+    def get_queryset(self, request):
+        """Annotate MM/YY expiry strings in the database."""
+        return super().get_queryset(request).annotate(
+            _expiry=Case(
+                When(
+                    expiry_month__gt=0, expiry_year__gt=0,
+                    then=Concat(
+                        LPad(Cast('expiry_month', CharField()), 2, Value('0')),
+                        Value('/'),
+                        # SQLite's MOD() returns a float, so make it an integer before
+                        # the text cast ("5", not "5.0")
+                        LPad(Cast(Cast(Mod('expiry_year', 100), IntegerField()), CharField()), 2, Value('0')),
+                    ),
+                ),
+                output_field=CharField(),
+            ),
         )
-    user_display.short_description = 'User'
     
     def brand_display(self, obj):
         """Display card brand with icon."""
         if obj.brand:
-            brand_icons = {
-                'visa': '💳',
-                'mastercard': '💳',
-                'amex': '💳',
-                'discover': '💳',
-            }
-            icon = brand_icons.get(obj.brand.lower(), '💳')
-            return format_html('{} {}', icon, obj.brand.title())
+            icon = _BRAND_ICONS.get(obj.brand.lower(), '💳')
+            return mark_safe(f'{icon} {escape(obj.brand.title())}')
         return '-'
     brand_display.short_description = 'Brand'
     
     def last4_display(self, obj):
         """Display masked card number."""
         if obj.last4:
-            return f'•••• •••• •••• {obj.last4}'
+            return _CARD_MASK + obj.last4
         return '-'
     last4_display.short_description = 'Card Number'
     
     def expiry_display(self, obj):
         """Display card expiry date."""
-        if obj.expiry_month and obj.expiry_year:
-            return f'{obj.expiry_month:02d}/{obj.expiry_year % 100:02d}'
-        return '-'
+        return obj._expiry or '-'
     expiry_display.short_description = 'Expires'
-    
-    def get_queryset(self, request):
-        """Optimize query with related objects."""
-        return super().get_queryset(request).select_related('user')
 
 
-@admin.register(Location)
-class LocationAdmin(admin.ModelAdmin):
+class LocationAdmin(_UserDisplayMixin, _ChangelistMixin, admin.ModelAdmin):
     """Location admin."""
     
     list_display = (
@@ -277,6 +370,8 @@ class LocationAdmin(admin.ModelAdmin):
     search_fields = ('user__username', 'user__email', 'name', 'address_line_1', 'city')
     readonly_fields = ('created_at', 'updated_at')
     ordering = ('-created_at',)
+    list_select_related = ('user',)
+    autocomplete_fields = ('user',)
     
     fieldsets = (
         ('User Information', {
@@ -298,15 +393,6 @@ class LocationAdmin(admin.ModelAdmin):
         }),
     )
     
-    def user_display(self, obj):
-        """Display user with name and email."""
-        name = obj.user.get_full_name() or obj.user.username
-        return format_html(
-            '<strong>{}</strong><br><small>{}</small>',
-            name, obj.user.email
-        )
-    user_display.short_description = 'User'
-    
     def address_display(self, obj):
         """Display short address."""
         address = obj.address_line_1
@@ -315,23 +401,28 @@ class LocationAdmin(admin.ModelAdmin):
         return address
     address_display.short_description = 'Address'
     
-    def get_queryset(self, request):
-        """Optimize query with related objects."""
-        return super().get_queryset(request).select_related('user')
-    
     actions = ['set_as_main_location']
     
     def set_as_main_location(self, request, queryset):
-        """Set selected locations as main."""
-        for location in queryset:
-            location.is_main = True
-            location.save()
-        self.message_user(request, f'{queryset.count()} location(s) set as main.')
+        """Set selected locations as main, keeping one main location per user."""
+        # Bulk updates bypass Location.save(), so enforce the one-main-per-user
+        # rule here: the most recently added selection wins for each user.
+        main_ids = list(
+            queryset.order_by().values('user').annotate(latest=Max('pk')).values_list('latest', flat=True)
+        )
+        # Demote before promoting: location_one_main_per_user is checked row
+        # by row, so a single UPDATE swapping mains could trip it midway
+        now = timezone.now()
+        with transaction.atomic():
+            Location.objects.filter(
+                user__in=queryset.values('user'), is_main=True,
+            ).exclude(pk__in=main_ids).update(is_main=False, updated_at=now)
+            Location.objects.filter(pk__in=main_ids, is_main=False).update(is_main=True, updated_at=now)
+        self.message_user(request, f'{len(main_ids)} location(s) set as main.')
     set_as_main_location.short_description = 'Set as main location'
 
 
-@admin.register(DistanceRequest)
-class DistanceRequestAdmin(admin.ModelAdmin):
+class DistanceRequestAdmin(_ChangelistMixin, admin.ModelAdmin):
     """Distance request admin."""
     
     list_display = (
@@ -340,15 +431,16 @@ class DistanceRequestAdmin(admin.ModelAdmin):
     )
     list_filter = ('status', 'created_at')
     search_fields = (
-        'provider__username', 'provider__email', 
+        'worker__user__username', 'worker__user__email', 
         'from_location', 'to_location', 'service_name'
     )
     readonly_fields = ('created_at', 'updated_at')
     ordering = ('-created_at',)
+    autocomplete_fields = ('worker', 'booking')
     
     fieldsets = (
         ('Provider Information', {
-            'fields': ('provider',),
+            'fields': ('worker',),
         }),
         ('Request Details', {
             'fields': ('booking', 'from_location', 'to_location', 
@@ -363,10 +455,15 @@ class DistanceRequestAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Annotate provider display names in the database."""
+        return super().get_queryset(request).annotate(
+            _provider_name=_display_name('worker__user__')
+        )
+    
     def provider_display(self, obj):
         """Display provider with name."""
-        name = obj.provider.get_full_name() or obj.provider.username
-        return name
+        return obj._provider_name or '-'
     provider_display.short_description = 'Provider'
     
     def route_display(self, obj):
@@ -378,14 +475,9 @@ class DistanceRequestAdmin(admin.ModelAdmin):
         """Display surcharge with currency."""
         return f"R$ {obj.surcharge_amount:.2f}"
     surcharge_display.short_description = 'Surcharge'
-    
-    def get_queryset(self, request):
-        """Optimize query with related objects."""
-        return super().get_queryset(request).select_related('provider', 'booking')
 
 
-@admin.register(ProviderDocument)
-class ProviderDocumentAdmin(admin.ModelAdmin):
+class ProviderDocumentAdmin(_ProviderDisplayMixin, _ChangelistMixin, admin.ModelAdmin):
     """Provider document admin."""
     
     list_display = (
@@ -400,6 +492,14 @@ class ProviderDocumentAdmin(admin.ModelAdmin):
     )
     readonly_fields = ('uploaded_at', 'verified_at', 'is_expired')
     ordering = ('-uploaded_at',)
+    list_select_related = ('provider__user',)
+    autocomplete_fields = ('provider', 'verified_by')
+    list_only_fields = (
+        'provider__user__username', 'provider__user__first_name', 'provider__user__last_name',
+        'provider__user__email',
+        'document_type', 'status', 'file_name', 'is_required',
+        'uploaded_at', 'expiry_date'
+    )
     
     fieldsets = (
         ('Provider Information', {
@@ -420,26 +520,10 @@ class ProviderDocumentAdmin(admin.ModelAdmin):
         }),
     )
     
-    def provider_display(self, obj):
-        """Display provider with name."""
-        name = obj.provider.user.get_full_name() or obj.provider.user.username
-        return format_html(
-            '<strong>{}</strong><br><small>{}</small>',
-            name, obj.provider.user.email
-        )
-    provider_display.short_description = 'Provider'
-    
-    def get_queryset(self, request):
-        """Optimize query with related objects."""
-        return super().get_queryset(request).select_related(
-            'provider__user', 'verified_by'
-        )
-    
     actions = ['verify_documents', 'reject_documents', 'mark_as_expired']
     
     def verify_documents(self, request, queryset):
         """Verify selected documents."""
-        from django.utils import timezone
         updated = queryset.update(
             status='verified',
             verified_by=request.user,
@@ -461,8 +545,7 @@ class ProviderDocumentAdmin(admin.ModelAdmin):
     mark_as_expired.short_description = 'Mark as expired'
 
 
-@admin.register(ProviderContract)
-class ProviderContractAdmin(admin.ModelAdmin):
+class ProviderContractAdmin(_ProviderDisplayMixin, _ChangelistMixin, admin.ModelAdmin):
     """Provider contract admin."""
     
     list_display = (
@@ -477,6 +560,14 @@ class ProviderContractAdmin(admin.ModelAdmin):
     )
     readonly_fields = ('created_at', 'is_active')
     ordering = ('-created_at',)
+    list_select_related = ('provider__user',)
+    autocomplete_fields = ('provider',)
+    list_only_fields = (
+        'provider__user__username', 'provider__user__first_name', 'provider__user__last_name',
+        'provider__user__email',
+        'title', 'contract_type', 'version', 'status',
+        'signed_at', 'expires_at'
+    )
     
     fieldsets = (
         ('Provider Information', {
@@ -497,24 +588,10 @@ class ProviderContractAdmin(admin.ModelAdmin):
         }),
     )
     
-    def provider_display(self, obj):
-        """Display provider with name."""
-        name = obj.provider.user.get_full_name() or obj.provider.user.username
-        return format_html(
-            '<strong>{}</strong><br><small>{}</small>',
-            name, obj.provider.user.email
-        )
-    provider_display.short_description = 'Provider'
-    
-    def get_queryset(self, request):
-        """Optimize query with related objects."""
-        return super().get_queryset(request).select_related('provider__user')
-    
     actions = ['mark_as_signed', 'mark_as_acknowledged']
     
     def mark_as_signed(self, request, queryset):
         """Mark selected contracts as signed."""
-        from django.utils import timezone
         updated = queryset.update(
             status='signed',
             signed_at=timezone.now()
@@ -524,7 +601,6 @@ class ProviderContractAdmin(admin.ModelAdmin):
     
     def mark_as_acknowledged(self, request, queryset):
         """Mark selected contracts as acknowledged."""
-        from django.utils import timezone
         updated = queryset.update(
             status='acknowledged',
             signed_at=timezone.now()
@@ -533,8 +609,7 @@ class ProviderContractAdmin(admin.ModelAdmin):
     mark_as_acknowledged.short_description = 'Mark as acknowledged'
 
 
-@admin.register(UserSettings)
-class UserSettingsAdmin(admin.ModelAdmin):
+class UserSettingsAdmin(_UserDisplayMixin, _ChangelistMixin, admin.ModelAdmin):
     """User settings admin."""
     
     list_display = (
@@ -548,6 +623,8 @@ class UserSettingsAdmin(admin.ModelAdmin):
     search_fields = ('user__username', 'user__email', 'user__first_name', 'user__last_name')
     readonly_fields = ('created_at', 'updated_at')
     ordering = ('-created_at',)
+    list_select_related = ('user',)
+    autocomplete_fields = ('user',)
     
     fieldsets = (
         ('User Information', {
@@ -580,16 +657,16 @@ class UserSettingsAdmin(admin.ModelAdmin):
             'classes': ('collapse',),
         }),
     )
-    
-    def user_display(self, obj):
-        """Display user with name and email."""
-        name = obj.user.get_full_name() or obj.user.username
-        return format_html(
-            '<strong>{}</strong><br><small>{}</small>',
-            name, obj.user.email
-        )
-    user_display.short_description = 'User'
-    
-    def get_queryset(self, request):
-        """Optimize query with related objects."""
-        return super().get_queryset(request).select_related('user')
+
+
+def register(site=admin.site):
+    """Register the accounts admins; called from AccountsConfig.ready()."""
+    site.register(User, UserAdmin)
+    site.register(ProviderProfile, ProviderProfileAdmin)
+    site.register(Profile, ProfileAdmin)
+    site.register(PaymentMethod, PaymentMethodAdmin)
+    site.register(Location, LocationAdmin)
+    site.register(DistanceRequest, DistanceRequestAdmin)
+    site.register(ProviderDocument, ProviderDocumentAdmin)
+    site.register(ProviderContract, ProviderContractAdmin)
+    site.register(UserSettings, UserSettingsAdmin)
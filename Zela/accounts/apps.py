@@ -7,3 +7,7 @@ class AccountsConfig(AppConfig):
     
     def ready(self):
         import accounts.signals
+        
+        if self.apps.is_installed('django.contrib.admin'):
+            from .admin import register
+            register()
@@ -0,0 +1,18 @@
+from django.contrib.admin.views.main import ChangeList
+
+
+class ColumnLimitedChangeList(ChangeList):
+    """ChangeList that loads only the model admin's ``list_only_fields``.
+
+    Admins opt in by returning this from ``get_changelist()`` and setting
+    ``list_only_fields`` to the columns ``list_display`` needs, including
+    ``list_select_related`` paths and anything ``__str__`` reads (the action
+    checkbox label). Leaving it unset or ``None`` loads every column.
+    """
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        list_only_fields = getattr(self.model_admin, 'list_only_fields', None)
+        if list_only_fields:
+            queryset = queryset.only(*list_only_fields)
+        return queryset
@@ -1,10 +1,27 @@
 from django import forms
 from .models import Location
 
+COUNTRY_CHOICES = (
+    ('AO', 'Angola'),
+    ('BR', 'Brazil'),
+    ('PT', 'Portugal'),
+    ('US', 'United States'),
+    ('GB', 'United Kingdom'),
+)
+
 
 class LocationForm(forms.ModelForm):
     """Form for creating and editing user locations."""
     
+    # Country choices - Angola as default
+    country = forms.ChoiceField(
+        choices=COUNTRY_CHOICES,
+        initial='AO',
+        widget=forms.Select(attrs={
+            'class': 'form-select'
+        })
+    )
+    
     class Meta:
         model = Location
         fields = ['name', 'address_line_1', 'address_line_2', 'city', 'province', 
@@ -34,9 +51,6 @@ class LocationForm(forms.ModelForm):
                 'class': 'form-input',
                 'placeholder': 'Postal code'
             }),
-            'country': forms.Select(attrs={
-                'class': 'form-select'
-            }),
             'is_main': forms.CheckboxInput(attrs={
                 'class': 'form-checkbox'
             })
@@ -49,13 +63,4 @@ class LocationForm(forms.ModelForm):
     
     def __init__(self, *args, **kwargs):
         self.user = kwargs.pop('user', None)
-        super().__init__(*args, **kwargs)
-        
-        # Country choices - Angola as default
-        self.fields['country'].choices = [
-            ('AO', 'Angola'),
-            ('BR', 'Brazil'),
-            ('PT', 'Portugal'),
-            ('US', 'United States'),
-            ('GB', 'United Kingdom'),
-        ]
\ No newline at end of file
+        super().__init__(*args, **kwargs)
\ No newline at end of file
@@ -1,72 +1,48 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
-from django.db import IntegrityError
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 
 User = get_user_model()
 
+DEFAULT_PASSWORD = 'Zela123!'
+
+# (label, email, extra user fields); the email doubles as the username
+DEFAULT_USERS = (
+    ('Superuser', 'admin@zela.com', {'role': 'admin', 'is_staff': True, 'is_superuser': True}),
+    ('Provider user', 'provider@zela.com', {'role': 'provider'}),
+)
+
 
 class Command(BaseCommand):
     help = 'Create a superuser and provider user for deployment'
 
     def handle(self, *args, **options):
-        # Create superuser
-        admin_email = 'admin@zela.com'
-        admin_password = 'Zela123!'
-        
-        try:
-            if User.objects.filter(email=admin_email).exists() or User.objects.filter(username=admin_email).exists():
-                self.stdout.write(
-                    self.style.WARNING(f'Superuser with email {admin_email} already exists.')
-                )
-            else:
-                user = User.objects.create_superuser(
-                    username=admin_email,
-                    email=admin_email,
-                    password=admin_password,
-                    role='admin',
-                    is_staff=True,
-                    is_superuser=True
-                )
-                
+        password = make_password(DEFAULT_PASSWORD)
+
+        for label, email, extra_fields in DEFAULT_USERS:
+            try:
+                # The address may already be taken as either a username or an email
+                if User.objects.filter(Q(username=email) | Q(email=email)).exists():
+                    self.stdout.write(
+                        self.style.WARNING(f'{label} with email {email} already exists.')
+                    )
+                    continue
+
+                # One transaction per user, so a failure only skips that user
+                with transaction.atomic():
+                    User.objects.create(username=email, email=email, password=password, **extra_fields)
+
                 self.stdout.write(
-                    self.style.SUCCESS(f'Superuser created successfully with email: {admin_email}')
+                    self.style.SUCCESS(f'{label} created successfully with email: {email}')
                 )
-            
-        except IntegrityError as e:
-            self.stdout.write(
-                self.style.ERROR(f'Error creating superuser: {e}')
-            )
-        except Exception as e:
-            self.stdout.write(
-                self.style.ERROR(f'Unexpected error creating superuser: {e}')
-            )
-        
-        # Create provider user
-        provider_email = 'provider@zela.com'
-        provider_password = 'Zela123!'
-        
-        try:
-            if User.objects.filter(email=provider_email).exists() or User.objects.filter(username=provider_email).exists():
+
+            except IntegrityError as e:
                 self.stdout.write(
-                    self.style.WARNING(f'Provider user with email {provider_email} already exists.')
-                )
-            else:
-                provider_user = User.objects.create_user(
-                    username=provider_email,
-                    email=provider_email,
-                    password=provider_password,
-                    role='provider'
+                    self.style.ERROR(f'Error creating {label.lower()}: {e}')
                 )
-                
+            except Exception as e:
                 self.stdout.write(
-                    self.style.SUCCESS(f'Provider user created successfully with email: {provider_email}')
+                    self.style.ERROR(f'Unexpected error creating {label.lower()}: {e}')
                 )
-            
-        except IntegrityError as e:
-            self.stdout.write(
-                self.style.ERROR(f'Error creating provider user: {e}')
-            )
-        except Exception as e:
-            self.stdout.write(
-                self.style.ERROR(f'Unexpected error creating provider user: {e}')
-            )
\ No newline at end of file
@@ -6,6 +6,25 @@ import random
 
 User = get_user_model()
 
+# Default schedule and coverage shared by every test provider
+DEFAULT_WORKING_HOURS = {
+    'monday': {'enabled': True, 'start': '07:00', 'end': '18:00'},
+    'tuesday': {'enabled': True, 'start': '07:00', 'end': '18:00'},
+    'wednesday': {'enabled': True, 'start': '07:00', 'end': '18:00'},
+    'thursday': {'enabled': True, 'start': '07:00', 'end': '18:00'},
+    'friday': {'enabled': True, 'start': '07:00', 'end': '18:00'},
+    'saturday': {'enabled': True, 'start': '08:00', 'end': '16:00'},
+    'sunday': {'enabled': False, 'start': '09:00', 'end': '14:00'},
+}
+
+DEFAULT_SERVICE_AREAS = [
+    {'name': 'Luanda Centro', 'enabled': True, 'surcharge': 0, 'color': '#10b981'},
+    {'name': 'Maianga', 'enabled': True, 'surcharge': 0, 'color': '#10b981'},
+    {'name': 'Ingombota', 'enabled': True, 'surcharge': 5, 'color': '#f59e0b'},
+    {'name': 'Rangel', 'enabled': True, 'surcharge': 10, 'color': '#f59e0b'},
+]
+
+
 class Command(BaseCommand):
     help = 'Creates test provider users with profiles'
 
@@ -22,7 +41,7 @@ class Command(BaseCommand):
                 'jobs_completed': 342,
                 'rating_average': 4.9,
                 'rating_count': 287,
-                'completion_rate': 98.5,
+                'jobs_total': 347,
                 'service_area': 'luanda-centro',
             },
             {
@@ -36,7 +55,7 @@ class Command(BaseCommand):
                 'jobs_completed': 189,
                 'rating_average': 4.8,
                 'rating_count': 156,
-                'completion_rate': 97.2,
+                'jobs_total': 194,
                 'service_area': 'maianga',
             },
             {
@@ -50,7 +69,7 @@ class Command(BaseCommand):
                 'jobs_completed': 267,
                 'rating_average': 4.95,
                 'rating_count': 234,
-                'completion_rate': 99.1,
+                'jobs_total': 269,
                 'service_area': 'ingombota',
             },
             {
@@ -64,7 +83,7 @@ class Command(BaseCommand):
                 'jobs_completed': 145,
                 'rating_average': 4.7,
                 'rating_count': 128,
-                'completion_rate': 96.8,
+                'jobs_total': 150,
                 'service_area': 'rangel',
             },
             {
@@ -78,78 +97,80 @@ class Command(BaseCommand):
                 'jobs_completed': 298,
                 'rating_average': 4.85,
                 'rating_count': 265,
-                'completion_rate': 97.9,
+                'jobs_total': 304,
                 'service_area': 'cazenga',
             }
         ]
 
         with transaction.atomic():
-            created_count = 0
+            existing = set(
+                User.objects.filter(
+                    username__in=[provider_data['username'] for provider_data in providers_data]
+                ).values_list('username', flat=True)
+            )
+
+            # Collect log lines and write them once at the end
+            output = []
+            new_providers = []
             for provider_data in providers_data:
                 # Check if user already exists
-                if User.objects.filter(username=provider_data['username']).exists():
-                    self.stdout.write(
+                if provider_data['username'] in existing:
+                    output.append(
                         self.style.WARNING(f"User {provider_data['username']} already exists, skipping...")
                     )
                     continue
+                new_providers.append(provider_data)
 
-                # Create user
-                user = User.objects.create_user(
-                    username=provider_data['username'],
-                    email=provider_data['email'],
-                    password='testpass123',
-                    first_name=provider_data['first_name'],
-                    last_name=provider_data['last_name']
-                )
-                # Update additional fields
-                user.phone = provider_data['phone_number']
-                user.role = 'provider'
-                user.locale = 'pt-AO'
-                user.save()
+            users = User.bulk_register([
+                {
+                    'username': provider_data['username'],
+                    'email': provider_data['email'],
+                    'password': 'testpass123',
+                    'first_name': provider_data['first_name'],
+                    'last_name': provider_data['last_name'],
+                    'phone': provider_data['phone_number'],
+                    'role': 'provider',
+                    'locale': 'pt-AO',
+                }
+                for provider_data in new_providers
+            ], batch_size=100)
 
-                # Create provider profile
-                profile = ProviderProfile.objects.create(
+            # Draw each randomized preference for all providers up front
+            count = len(users)
+            same_day = random.choices([True, False], k=count)
+            travel_distances = random.choices([15, 20, 25, 30], k=count)
+            radii = random.choices([5, 10, 15], k=count)
+            tolls = random.choices([True, False], k=count)
+
+            ProviderProfile.objects.bulk_create([
+                ProviderProfile(
                     user=user,
                     bio=provider_data['bio'],
                     skills=provider_data['skills'],
                     jobs_completed=provider_data['jobs_completed'],
                     rating_average=provider_data['rating_average'],
                     rating_count=provider_data['rating_count'],
-                    completion_rate=provider_data['completion_rate'],
+                    jobs_total=provider_data['jobs_total'],
                     service_area=provider_data['service_area'],
                     is_approved=True,  # Auto-approve for testing
                     is_available=True,
-                    accepts_same_day=random.choice([True, False]),
-                    # Set some default working hours
-                    working_hours={
-                        'monday': {'enabled': True, 'start': '07:00', 'end': '18:00'},
-                        'tuesday': {'enabled': True, 'start': '07:00', 'end': '18:00'},
-                        'wednesday': {'enabled': True, 'start': '07:00', 'end': '18:00'},
-                        'thursday': {'enabled': True, 'start': '07:00', 'end': '18:00'},
-                        'friday': {'enabled': True, 'start': '07:00', 'end': '18:00'},
-                        'saturday': {'enabled': True, 'start': '08:00', 'end': '16:00'},
-                        'sunday': {'enabled': False, 'start': '09:00', 'end': '14:00'},
-                    },
-                    service_areas=[
-                        {'name': 'Luanda Centro', 'enabled': True, 'surcharge': 0, 'color': '#10b981'},
-                        {'name': 'Maianga', 'enabled': True, 'surcharge': 0, 'color': '#10b981'},
-                        {'name': 'Ingombota', 'enabled': True, 'surcharge': 5, 'color': '#f59e0b'},
-                        {'name': 'Rangel', 'enabled': True, 'surcharge': 10, 'color': '#f59e0b'},
-                    ],
-                    max_travel_distance=random.choice([15, 20, 25, 30]),
-                    preferred_radius=random.choice([5, 10, 15]),
-                    avoid_tolls=random.choice([True, False]),
-                )
-
-                created_count += 1
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Created provider: {user.get_full_name()} ({user.username})"
-                    )
+                    accepts_same_day=same_day[i],
+                    working_hours=DEFAULT_WORKING_HOURS,
+                    service_areas=DEFAULT_SERVICE_AREAS,
+                    max_travel_distance=travel_distances[i],
+                    preferred_radius=radii[i],
+                    avoid_tolls=tolls[i],
                 )
+                for i, (user, provider_data) in enumerate(zip(users, new_providers))
+            ], batch_size=100)
 
-            self.stdout.write(
+            output.extend(
+                self.style.SUCCESS(f"Created provider: {user.get_full_name()} ({user.username})")
+                for user in users
+            )
+            output.append(
                 self.style.SUCCESS(
-                    f"\nSuccessfully created {created_count} provider users!"
+                    f"\nSuccessfully created {len(users)} provider users!"
                 )
-            )
\ No newline at end of file
+            )
+            self.stdout.write('\n'.join(output))
\ No newline at end of file
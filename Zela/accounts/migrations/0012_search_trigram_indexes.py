@@ -0,0 +1,42 @@
+from django.db import migrations
+
+# (index name, table, column) for the text columns searched by the accounts
+# admins. Django's icontains lookup compiles to UPPER("col"::text) LIKE ...,
+# so the trigram indexes are built on that exact expression.
+TRIGRAM_INDEXES = [
+    ('user_email_trgm', 'auth_user', 'email'),
+    ('providerdocument_file_name_trgm', 'accounts_providerdocument', 'file_name'),
+    ('distancerequest_service_name_trgm', 'accounts_distancerequest', 'service_name'),
+    ('location_city_trgm', 'accounts_location', 'city'),
+    ('paymentmethod_last4_trgm', 'accounts_paymentmethod', 'last4'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Create pg_trgm GIN indexes; other backends keep plain LIKE scans."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_remove_distancerequest_provider_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.4 on 2025-10-02 10:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role'], name='auth_user_role_f90fd2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='providerprofile',
+            index=models.Index(fields=['is_approved', 'is_available'], name='accounts_pr_is_appr_c20b42_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='providerprofile',
+            index=models.Index(fields=['service_area'], name='accounts_pr_service_c1311c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='providerdocument',
+            index=models.Index(fields=['status', '-uploaded_at'], name='accounts_pr_status_d0d8ee_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='providercontract',
+            index=models.Index(fields=['status', '-created_at'], name='accounts_pr_status_4d32a4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='paymentmethod',
+            index=models.Index(fields=['user', '-is_default', '-added_at'], name='accounts_pa_user_id_ab53a1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='distancerequest',
+            index=models.Index(fields=['worker', 'status', '-created_at'], name='accounts_di_worker__395576_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(fields=['user', '-is_main', '-created_at'], name='accounts_lo_user_id_df3d59_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.4 on 2025-10-02 11:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0013_add_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='profile',
+            name='id',
+        ),
+        migrations.AlterField(
+            model_name='profile',
+            name='user',
+            field=models.OneToOneField(help_text='User account for this profile', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='profile', serialize=False, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RemoveField(
+            model_name='usersettings',
+            name='id',
+        ),
+        migrations.AlterField(
+            model_name='usersettings',
+            name='user',
+            field=models.OneToOneField(help_text='User account for these settings', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='settings', serialize=False, to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.4 on 2025-10-02 11:40
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0014_profile_usersettings_user_primary_key'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='providerprofile',
+            name='completion_rate',
+        ),
+        migrations.AddField(
+            model_name='providerprofile',
+            name='completion_rate',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(jobs_total__gt=0, then=django.db.models.functions.comparison.Cast(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.F('jobs_completed'), '*', models.Value(100.0)), '/', models.F('jobs_total')), models.DecimalField(decimal_places=2, max_digits=5))), default=models.Value(Decimal('0'))), help_text='Job completion rate percentage', output_field=models.DecimalField(decimal_places=2, max_digits=5)),
+        ),
+    ]
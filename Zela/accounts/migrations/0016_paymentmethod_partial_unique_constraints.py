@@ -0,0 +1,39 @@
+# Generated by Django 5.2.4 on 2025-10-02 12:25
+
+from django.db import migrations, models
+
+
+def clear_duplicate_defaults(apps, schema_editor):
+    """Keep only the newest active default payment method per user."""
+    PaymentMethod = apps.get_model('accounts', 'PaymentMethod')
+    seen_users = set()
+    stale_ids = []
+    defaults = PaymentMethod.objects.filter(is_default=True, is_active=True).order_by('user_id', '-added_at')
+    for pk, user_id in defaults.values_list('pk', 'user_id'):
+        if user_id in seen_users:
+            stale_ids.append(pk)
+        seen_users.add(user_id)
+    PaymentMethod.objects.filter(pk__in=stale_ids).update(is_default=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0015_providerprofile_generated_completion_rate'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_duplicate_defaults, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='paymentmethod',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='paymentmethod',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('user', 'provider_id'), name='paymentmethod_unique_active_provider'),
+        ),
+        migrations.AddConstraint(
+            model_name='paymentmethod',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True), ('is_default', True)), fields=('user',), name='paymentmethod_one_default_per_user'),
+        ),
+    ]
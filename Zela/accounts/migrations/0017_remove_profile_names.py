@@ -0,0 +1,44 @@
+# Generated by Django 5.2.4 on 2025-10-02 13:10
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+NAME_FIELDS = ('first_name', 'last_name')
+
+
+def copy_names_to_user(apps, schema_editor):
+    """Fill blank user names from the profile copy before it is dropped."""
+    User = apps.get_model('accounts', 'User')
+    Profile = apps.get_model('accounts', 'Profile')
+    for field in NAME_FIELDS:
+        User.objects.filter(**{field: '', f'profile__{field}__gt': ''}).update(
+            **{field: Subquery(Profile.objects.filter(user=OuterRef('pk')).values(field)[:1])}
+        )
+
+
+def copy_names_to_profile(apps, schema_editor):
+    User = apps.get_model('accounts', 'User')
+    Profile = apps.get_model('accounts', 'Profile')
+    for field in NAME_FIELDS:
+        Profile.objects.update(
+            **{field: Subquery(User.objects.filter(pk=OuterRef('user')).values(field)[:1])}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0016_paymentmethod_partial_unique_constraints'),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_names_to_user, copy_names_to_profile),
+        migrations.RemoveField(
+            model_name='profile',
+            name='first_name',
+        ),
+        migrations.RemoveField(
+            model_name='profile',
+            name='last_name',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2025-10-02 13:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0017_remove_profile_names'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['email'], name='auth_user_email_ece7f7_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2025-10-02 13:55
+
+from django.db import migrations, models
+
+
+def clear_duplicate_mains(apps, schema_editor):
+    """Keep only the newest main location per user."""
+    Location = apps.get_model('accounts', 'Location')
+    seen_users = set()
+    stale_ids = []
+    mains = Location.objects.filter(is_main=True).order_by('user_id', '-created_at', '-pk')
+    for pk, user_id in mains.values_list('pk', 'user_id'):
+        if user_id in seen_users:
+            stale_ids.append(pk)
+        seen_users.add(user_id)
+    Location.objects.filter(pk__in=stale_ids).update(is_main=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0018_user_email_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_duplicate_mains, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='location',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_main', True)), fields=('user',), name='location_one_main_per_user'),
+        ),
+    ]
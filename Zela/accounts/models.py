@@ -1,22 +1,26 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Cast
+from django.utils import timezone
 from django.core.validators import FileExtensionValidator
+from decimal import Decimal
 from typing import List
+import copy
 
 
 class User(AbstractUser):
     """Custom user model extending Django's AbstractUser."""
     
-    ROLE_CHOICES = [
-        ("customer", "Customer"),
-        ("provider", "Provider"),
-        ("admin", "Admin"),
-    ]
+    class Role(models.TextChoices):
+        CUSTOMER = "customer", "Customer"
+        PROVIDER = "provider", "Provider"
+        ADMIN = "admin", "Admin"
     
     role = models.CharField(
         max_length=10,
-        choices=ROLE_CHOICES,
-        default="customer",
+        choices=Role.choices,
+        default=Role.CUSTOMER,
         help_text="User role in the system"
     )
     phone = models.CharField(
@@ -33,10 +37,36 @@ class User(AbstractUser):
     def __str__(self) -> str:
         return f"{self.username} ({self.get_role_display()})"
     
+    @classmethod
+    def bulk_register(cls, rows, batch_size=500):
+        """Create users from ``rows`` (dicts of field values) along with their profiles.
+        
+        Each row's ``password`` is a raw password and is hashed like
+        ``create_user`` does; rows without one get an unusable password.
+        ``bulk_create`` skips the post_save signal that normally creates the
+        profile, so profiles are inserted here in the same batches.
+        """
+        users = []
+        for row in rows:
+            row = dict(row)
+            password = row.pop('password', None)
+            user = cls(**row)
+            user.set_password(password)
+            users.append(user)
+        
+        with transaction.atomic():
+            users = cls.objects.bulk_create(users, batch_size=batch_size)
+            Profile.bulk_ensure(users, batch_size=batch_size)
+        return users
+    
     class Meta:
         db_table = 'auth_user'
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            models.Index(fields=['role']),
+            models.Index(fields=['email']),
+        ]
 
 
 class Profile(models.Model):
@@ -45,19 +75,10 @@ class Profile(models.Model):
     user = models.OneToOneField(
         User,
         on_delete=models.CASCADE,
+        primary_key=True,
         related_name="profile", 
         help_text="User account for this profile"
     )
-    first_name = models.CharField(
-        max_length=150,
-        blank=True,
-        help_text="User's first name"
-    )
-    last_name = models.CharField(
-        max_length=150,
-        blank=True,
-        help_text="User's last name"
-    )
     profile_picture = models.ImageField(
         upload_to="profile_pictures/",
         blank=True,
@@ -100,8 +121,43 @@ class Profile(models.Model):
     
     def __str__(self) -> str:
         return f"{self.user.get_full_name() or self.user.username} - Profile"
+    
+    @classmethod
+    def bulk_ensure(cls, users, batch_size=500):
+        """Create missing profiles for ``users`` in bulk.
+        
+        Users that already have a profile are skipped by the database
+        (``ON CONFLICT DO NOTHING``), so this is safe to call with any users.
+        """
+        return cls.objects.bulk_create(
+            [cls(user=user) for user in users],
+            batch_size=batch_size,
+            ignore_conflicts=True
+        )
      
 
+# Defaults for new provider schedules and coverage. Treat these as read-only;
+# ProviderProfile.get_default_*() return copies that are safe to modify.
+DEFAULT_WORKING_HOURS = {
+    'monday': {'enabled': True, 'start': '08:00', 'end': '18:00'},
+    'tuesday': {'enabled': True, 'start': '08:00', 'end': '18:00'},
+    'wednesday': {'enabled': True, 'start': '08:00', 'end': '18:00'},
+    'thursday': {'enabled': True, 'start': '08:00', 'end': '18:00'},
+    'friday': {'enabled': True, 'start': '08:00', 'end': '18:00'},
+    'saturday': {'enabled': True, 'start': '09:00', 'end': '16:00'},
+    'sunday': {'enabled': False, 'start': '10:00', 'end': '15:00'}
+}
+
+DEFAULT_SERVICE_AREAS = [
+    {'name': 'Luanda Centro', 'enabled': True, 'surcharge': 0, 'color': '#10b981'},
+    {'name': 'Maianga', 'enabled': True, 'surcharge': 0, 'color': '#10b981'},
+    {'name': 'Ingombota', 'enabled': True, 'surcharge': 5, 'color': '#f59e0b'},
+    {'name': 'Rangel', 'enabled': True, 'surcharge': 10, 'color': '#f59e0b'},
+    {'name': 'Cazenga', 'enabled': False, 'surcharge': 15, 'color': '#ef4444'},
+    {'name': 'Viana', 'enabled': False, 'surcharge': 20, 'color': '#ef4444'}
+]
+
+
 class ProviderProfile(models.Model):
     """Extended profile for service providers.
     
@@ -162,10 +218,19 @@ class ProviderProfile(models.Model):
         default=0,
         help_text="Total number of jobs assigned"
     )
-    completion_rate = models.DecimalField(
-        max_digits=5,
-        decimal_places=2,
-        default=0,
+    completion_rate = models.GeneratedField(
+        expression=Case(
+            When(
+                jobs_total__gt=0,
+                then=Cast(
+                    F('jobs_completed') * 100.0 / F('jobs_total'),
+                    models.DecimalField(max_digits=5, decimal_places=2)
+                )
+            ),
+            default=Value(Decimal('0')),
+        ),
+        output_field=models.DecimalField(max_digits=5, decimal_places=2),
+        db_persist=True,
         help_text="Job completion rate percentage"
     )
     
@@ -228,40 +293,28 @@ class ProviderProfile(models.Model):
             return "No ratings yet"
         return f"{self.rating_average:.1f} ({self.rating_count} reviews)"
     
-    def update_completion_rate(self):
-        """Update the completion rate based on jobs completed vs total."""
-        if self.jobs_total > 0:
-            self.completion_rate = (self.jobs_completed / self.jobs_total) * 100
-        else:
-            self.completion_rate = 0
-        self.save(update_fields=['completion_rate'])
-    
     def get_default_working_hours(self):
         """Return default working hours structure."""
-        return {
-            'monday': {'enabled': True, 'start': '08:00', 'end': '18:00'},
-            'tuesday': {'enabled': True, 'start': '08:00', 'end': '18:00'},
-            'wednesday': {'enabled': True, 'start': '08:00', 'end': '18:00'},
-            'thursday': {'enabled': True, 'start': '08:00', 'end': '18:00'},
-            'friday': {'enabled': True, 'start': '08:00', 'end': '18:00'},
-            'saturday': {'enabled': True, 'start': '09:00', 'end': '16:00'},
-            'sunday': {'enabled': False, 'start': '10:00', 'end': '15:00'}
-        }
+        return copy.deepcopy(DEFAULT_WORKING_HOURS)
     
     def get_default_service_areas(self):
         """Return default service areas for Luanda."""
-        return [
-            {'name': 'Luanda Centro', 'enabled': True, 'surcharge': 0, 'color': '#10b981'},
-            {'name': 'Maianga', 'enabled': True, 'surcharge': 0, 'color': '#10b981'},
-            {'name': 'Ingombota', 'enabled': True, 'surcharge': 5, 'color': '#f59e0b'},
-            {'name': 'Rangel', 'enabled': True, 'surcharge': 10, 'color': '#f59e0b'},
-            {'name': 'Cazenga', 'enabled': False, 'surcharge': 15, 'color': '#ef4444'},
-            {'name': 'Viana', 'enabled': False, 'surcharge': 20, 'color': '#ef4444'}
-        ]
+        return copy.deepcopy(DEFAULT_SERVICE_AREAS)
     
     class Meta:
         verbose_name = 'Provider Profile'
         verbose_name_plural = 'Provider Profiles'
+        indexes = [
+            models.Index(fields=['is_approved', 'is_available']),
+            models.Index(fields=['service_area']),
+        ]
+
+
+class ProviderRecordManager(models.Manager):
+    """Default manager for provider-owned records; ``__str__`` needs the provider's user."""
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related('provider__user')
 
 
 class ProviderDocument(models.Model):
@@ -270,22 +323,20 @@ class ProviderDocument(models.Model):
     DEPRECATED: Document verification is now handled in workers.Worker models.
     """
     
-    DOCUMENT_TYPES = [
-        ('national_id', 'National ID'),
-        ('proof_address', 'Proof of Address'),
-        ('bank_statement', 'Bank Statement'),
-        ('criminal_record', 'Criminal Record Check'),
-        ('insurance', 'Insurance Certificate'),
-        ('license', 'Professional License'),
-        ('other', 'Other Document'),
-    ]
-    
-    STATUS_CHOICES = [
-        ('pending', 'Pending Review'),
-        ('verified', 'Verified'),
-        ('rejected', 'Rejected'),
-        ('expired', 'Expired'),
-    ]
+    class DocumentType(models.TextChoices):
+        NATIONAL_ID = 'national_id', 'National ID'
+        PROOF_ADDRESS = 'proof_address', 'Proof of Address'
+        BANK_STATEMENT = 'bank_statement', 'Bank Statement'
+        CRIMINAL_RECORD = 'criminal_record', 'Criminal Record Check'
+        INSURANCE = 'insurance', 'Insurance Certificate'
+        LICENSE = 'license', 'Professional License'
+        OTHER = 'other', 'Other Document'
+    
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending Review'
+        VERIFIED = 'verified', 'Verified'
+        REJECTED = 'rejected', 'Rejected'
+        EXPIRED = 'expired', 'Expired'
     
     provider = models.ForeignKey(
         ProviderProfile,
@@ -295,7 +346,7 @@ class ProviderDocument(models.Model):
     )
     document_type = models.CharField(
         max_length=20,
-        choices=DOCUMENT_TYPES,
+        choices=DocumentType.choices,
         help_text="Type of document"
     )
     file = models.FileField(
@@ -310,8 +361,8 @@ class ProviderDocument(models.Model):
     )
     status = models.CharField(
         max_length=20,
-        choices=STATUS_CHOICES,
-        default='pending',
+        choices=Status.choices,
+        default=Status.PENDING,
         help_text="Document verification status"
     )
     is_required = models.BooleanField(
@@ -338,6 +389,8 @@ class ProviderDocument(models.Model):
         help_text="Admin who verified this document"
     )
     
+    objects = ProviderRecordManager()
+    
     def __str__(self) -> str:
         return f"{self.provider.user.get_full_name()} - {self.get_document_type_display()}"
     
@@ -345,7 +398,6 @@ class ProviderDocument(models.Model):
     def is_expired(self) -> bool:
         """Check if document is expired."""
         if self.expiry_date:
-            from django.utils import timezone
             return self.expiry_date < timezone.now().date()
         return False
     
@@ -354,6 +406,9 @@ class ProviderDocument(models.Model):
         verbose_name_plural = "Provider Documents"
         ordering = ['-uploaded_at']
         unique_together = [['provider', 'document_type']]
+        indexes = [
+            models.Index(fields=['status', '-uploaded_at']),
+        ]
 
 
 class ProviderContract(models.Model):
@@ -362,20 +417,18 @@ class ProviderContract(models.Model):
     DEPRECATED: Contract management is now handled in workers.Worker models.
     """
     
-    CONTRACT_TYPES = [
-        ('service_agreement', 'Service Provider Agreement'),
-        ('privacy_policy', 'Privacy Policy'),
-        ('terms_service', 'Terms of Service'),
-        ('nda', 'Non-Disclosure Agreement'),
-        ('commission_agreement', 'Commission Agreement'),
-    ]
-    
-    STATUS_CHOICES = [
-        ('pending', 'Pending'),
-        ('signed', 'Signed'),
-        ('acknowledged', 'Acknowledged'),
-        ('expired', 'Expired'),
-    ]
+    class ContractType(models.TextChoices):
+        SERVICE_AGREEMENT = 'service_agreement', 'Service Provider Agreement'
+        PRIVACY_POLICY = 'privacy_policy', 'Privacy Policy'
+        TERMS_SERVICE = 'terms_service', 'Terms of Service'
+        NDA = 'nda', 'Non-Disclosure Agreement'
+        COMMISSION_AGREEMENT = 'commission_agreement', 'Commission Agreement'
+    
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        SIGNED = 'signed', 'Signed'
+        ACKNOWLEDGED = 'acknowledged', 'Acknowledged'
+        EXPIRED = 'expired', 'Expired'
     
     provider = models.ForeignKey(
         ProviderProfile,
@@ -385,7 +438,7 @@ class ProviderContract(models.Model):
     )
     contract_type = models.CharField(
         max_length=30,
-        choices=CONTRACT_TYPES,
+        choices=ContractType.choices,
         help_text="Type of contract"
     )
     title = models.CharField(
@@ -403,8 +456,8 @@ class ProviderContract(models.Model):
     )
     status = models.CharField(
         max_length=20,
-        choices=STATUS_CHOICES,
-        default='pending',
+        choices=Status.choices,
+        default=Status.PENDING,
         help_text="Contract status"
     )
     signed_at = models.DateTimeField(
@@ -424,6 +477,8 @@ class ProviderContract(models.Model):
         help_text="Contract expiry date"
     )
     
+    objects = ProviderRecordManager()
+    
     def __str__(self) -> str:
         return f"{self.provider.user.get_full_name()} - {self.title}"
     
@@ -433,7 +488,6 @@ class ProviderContract(models.Model):
         if self.status not in ['signed', 'acknowledged']:
             return False
         if self.expires_at:
-            from django.utils import timezone
             return self.expires_at > timezone.now()
         return True
     
@@ -442,6 +496,28 @@ class ProviderContract(models.Model):
         verbose_name_plural = "Provider Contracts"
         ordering = ['-created_at']
         unique_together = [['provider', 'contract_type', 'version']]
+        indexes = [
+            models.Index(fields=['status', '-created_at']),
+        ]
+
+
+class PaymentMethodQuerySet(models.QuerySet):
+    def with_display(self):
+        """Annotate ``_is_expired`` so ``is_expired`` is answered by the database."""
+        today = timezone.localdate()
+        return self.annotate(
+            _is_expired=Case(
+                When(
+                    Q(expiry_year__lt=today.year) | Q(expiry_year=today.year, expiry_month__lt=today.month),
+                    kind=PaymentMethod.Kind.CARD,
+                    expiry_month__gt=0,
+                    expiry_year__gt=0,
+                    then=Value(True),
+                ),
+                default=Value(False),
+                output_field=models.BooleanField(),
+            )
+        )
 
 
 class PaymentMethod(models.Model):
@@ -472,22 +548,24 @@ class PaymentMethod(models.Model):
                                       help_text="Whether this payment method is active")
     added_at     = models.DateTimeField(auto_now_add=True)
     
+    objects = PaymentMethodQuerySet.as_manager()
+    
     def __str__(self) -> str:
         if self.kind == self.Kind.CARD and self.brand and self.last4:
-            return f"{self.brand.title()} •••• {self.last4}"
+            return self.display_name
         return f"{self.get_kind_display()} - {self.user.username}"
     
     @property
     def is_expired(self) -> bool:
         """Check if card is expired."""
+        if '_is_expired' in self.__dict__:
+            return self._is_expired
         if self.kind != self.Kind.CARD or not self.expiry_month or not self.expiry_year:
             return False
         
-        from datetime import datetime
-        now = datetime.now()
+        today = timezone.localdate()
         # Cards expire at end of month
-        return (self.expiry_year < now.year or 
-                (self.expiry_year == now.year and self.expiry_month < now.month))
+        return (self.expiry_year, self.expiry_month) < (today.year, today.month)
     
     @property
     def display_name(self) -> str:
@@ -502,19 +580,32 @@ class PaymentMethod(models.Model):
         verbose_name = "Payment Method"
         verbose_name_plural = "Payment Methods"
         ordering = ['-is_default', '-added_at']
-        unique_together = [['user', 'provider_id']]
+        indexes = [
+            models.Index(fields=['user', '-is_default', '-added_at']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'provider_id'],
+                condition=Q(is_active=True),
+                name='paymentmethod_unique_active_provider',
+            ),
+            models.UniqueConstraint(
+                fields=['user'],
+                condition=Q(is_default=True, is_active=True),
+                name='paymentmethod_one_default_per_user',
+            ),
+        ]
 
 
 class DistanceRequest(models.Model):
     """Track distance-based service requests to/from workers."""
     
-    STATUS_CHOICES = [
-        ('pending', 'Pending'),
-        ('accepted', 'Accepted'),
-        ('declined', 'Declined'),
-        ('completed', 'Completed'),
-        ('expired', 'Expired'),
-    ]
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        ACCEPTED = 'accepted', 'Accepted'
+        DECLINED = 'declined', 'Declined'
+        COMPLETED = 'completed', 'Completed'
+        EXPIRED = 'expired', 'Expired'
     
     worker = models.ForeignKey(
         'workers.Worker',
@@ -557,8 +648,8 @@ class DistanceRequest(models.Model):
     )
     status = models.CharField(
         max_length=20,
-        choices=STATUS_CHOICES,
-        default='pending',
+        choices=Status.choices,
+        default=Status.PENDING,
         help_text="Request status"
     )
     created_at = models.DateTimeField(auto_now_add=True)
@@ -571,14 +662,43 @@ class DistanceRequest(models.Model):
         verbose_name = "Distance Request"
         verbose_name_plural = "Distance Requests"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['worker', 'status', '-created_at']),
+        ]
 
 
 class UserSettings(models.Model):
     """User settings and preferences."""
     
+    class Visibility(models.TextChoices):
+        PUBLIC = 'public', 'Public'
+        CUSTOMERS = 'customers', 'Customers Only'
+        PRIVATE = 'private', 'Private'
+
+    class Language(models.TextChoices):
+        PT = 'pt', 'Português'
+        EN = 'en', 'English'
+        FR = 'fr', 'Français'
+
+    class Currency(models.TextChoices):
+        AOA = 'AOA', 'Kwanza (AOA)'
+        USD = 'USD', 'US Dollar (USD)'
+        EUR = 'EUR', 'Euro (EUR)'
+
+    class Theme(models.TextChoices):
+        LIGHT = 'light', 'Light'
+        DARK = 'dark', 'Dark'
+        AUTO = 'auto', 'Auto'
+
+    class MapView(models.TextChoices):
+        STANDARD = 'standard', 'Standard'
+        SATELLITE = 'satellite', 'Satellite'
+        HYBRID = 'hybrid', 'Hybrid'
+    
     user = models.OneToOneField(
         User,
         on_delete=models.CASCADE,
+        primary_key=True,
         related_name="settings",
         help_text="User account for these settings"
     )
@@ -608,12 +728,8 @@ class UserSettings(models.Model):
     # Privacy Settings
     profile_visibility = models.CharField(
         max_length=20,
-        choices=[
-            ('public', 'Public'),
-            ('customers', 'Customers Only'),
-            ('private', 'Private')
-        ],
-        default='public',
+        choices=Visibility.choices,
+        default=Visibility.PUBLIC,
         help_text="Control who can see your profile information"
     )
     share_location = models.BooleanField(
@@ -662,12 +778,8 @@ class UserSettings(models.Model):
     # App Preferences
     language = models.CharField(
         max_length=5,
-        choices=[
-            ('pt', 'Português'),
-            ('en', 'English'),
-            ('fr', 'Français')
-        ],
-        default='pt',
+        choices=Language.choices,
+        default=Language.PT,
         help_text="Preferred language"
     )
     timezone = models.CharField(
@@ -677,32 +789,20 @@ class UserSettings(models.Model):
     )
     currency = models.CharField(
         max_length=3,
-        choices=[
-            ('AOA', 'Kwanza (AOA)'),
-            ('USD', 'US Dollar (USD)'),
-            ('EUR', 'Euro (EUR)')
-        ],
-        default='AOA',
+        choices=Currency.choices,
+        default=Currency.AOA,
         help_text="Preferred currency"
     )
     theme = models.CharField(
         max_length=10,
-        choices=[
-            ('light', 'Light'),
-            ('dark', 'Dark'),
-            ('auto', 'Auto')
-        ],
-        default='light',
+        choices=Theme.choices,
+        default=Theme.LIGHT,
         help_text="App theme"
     )
     map_view = models.CharField(
         max_length=20,
-        choices=[
-            ('standard', 'Standard'),
-            ('satellite', 'Satellite'),
-            ('hybrid', 'Hybrid')
-        ],
-        default='satellite',
+        choices=MapView.choices,
+        default=MapView.SATELLITE,
         help_text="Preferred map view"
     )
     
@@ -714,9 +814,26 @@ class UserSettings(models.Model):
     
     @classmethod
     def get_or_create_for_user(cls, user):
-        """Get or create settings for a user."""
-        settings, created = cls.objects.get_or_create(user=user)
-        return settings
+        """Get or create settings for a user.
+        
+        Goes through the ``user.settings`` reverse accessor first, so settings
+        already loaded via ``select_related('settings')`` (or by an earlier
+        call on the same user) cost no query.
+        """
+        try:
+            return user.settings
+        except cls.DoesNotExist:
+            settings, created = cls.objects.get_or_create(user=user)
+            return settings
+    
+    @classmethod
+    def bulk_ensure(cls, users, batch_size=500):
+        """Create default settings for any of ``users`` that have none, in bulk."""
+        return cls.objects.bulk_create(
+            [cls(user=user) for user in users],
+            batch_size=batch_size,
+            ignore_conflicts=True
+        )
     
     class Meta:
         verbose_name = "User Settings"
@@ -787,16 +904,37 @@ class Location(models.Model):
     def __str__(self) -> str:
         return f"{self.name} - {self.address_line_1}, {self.city}"
     
+    # is_main as last loaded from or written to the database
+    _was_main = False
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._was_main = 'is_main' in field_names and instance.is_main
+        return instance
+    
     def save(self, *args, **kwargs):
         """Ensure only one main location per user."""
-        if self.is_main:
-            # Set all other locations for this user to not main
-            Location.objects.filter(user=self.user, is_main=True).exclude(pk=self.pk).update(is_main=False)
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            if self.is_main and not self._was_main:
+                # Set all other locations for this user to not main
+                Location.objects.filter(user_id=self.user_id, is_main=True).exclude(pk=self.pk).update(is_main=False)
+            super().save(*args, **kwargs)
+        self._was_main = self.is_main
+    
+    def get_constraints(self):
+        # save() demotes the user's previous main location, so forms must not
+        # reject a new main one; the database still enforces the constraint
+        return [
+            (model_class, [c for c in constraints if c.name != 'location_one_main_per_user'])
+            for model_class, constraints in super().get_constraints()
+        ]
     
     @property
     def full_address(self) -> str:
         """Return full formatted address."""
+        if not self.address_line_2 and not self.postal_code:
+            return f"{self.address_line_1}, {self.city}, {self.province}, {self.country}"
         parts = [self.address_line_1]
         if self.address_line_2:
             parts.append(self.address_line_2)
@@ -809,4 +947,14 @@ class Location(models.Model):
     class Meta:
         verbose_name = "Location"
         verbose_name_plural = "Locations"
-        ordering = ['-is_main', '-created_at']
\ No newline at end of file
+        ordering = ['-is_main', '-created_at']
+        indexes = [
+            models.Index(fields=['user', '-is_main', '-created_at']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user'],
+                condition=Q(is_main=True),
+                name='location_one_main_per_user',
+            ),
+        ]
\ No newline at end of file
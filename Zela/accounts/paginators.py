@@ -0,0 +1,54 @@
+import hashlib
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that avoids exact COUNT(*) queries on large tables.
+
+    Unfiltered PostgreSQL querysets use the planner's row estimate from
+    pg_class once the table is big enough for the estimate to be useful;
+    every other queryset gets an exact count cached for
+    ``count_cache_timeout`` seconds. Nothing invalidates that cache, so
+    totals shown right after rows are added or deleted can be stale for up
+    to that long; keep the timeout short.
+    """
+
+    estimate_threshold = 10000
+    count_cache_timeout = 30
+
+    @cached_property
+    def count(self):
+        """Return the (possibly estimated) total number of objects."""
+        object_list = self.object_list
+        if not isinstance(object_list, QuerySet):
+            return super().count
+        if object_list.query.is_empty():
+            return 0
+
+        if not object_list.query.where:
+            estimate = self._estimate(object_list)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+
+        digest = hashlib.md5(f'{object_list.db}:{object_list.query}'.encode(), usedforsecurity=False).hexdigest()
+        return cache.get_or_set(f'paginator-count:{digest}', object_list.count, self.count_cache_timeout)
+
+    @staticmethod
+    def _estimate(queryset):
+        """Return PostgreSQL's row estimate for the queryset's table, if available."""
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+        return row[0] if row else None
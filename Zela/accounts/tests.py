@@ -1,3 +1,487 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.test import RequestFactory, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .admin import JSONArrayLength, PaymentMethodAdmin
+from .models import Location, PaymentMethod, Profile, ProviderContract, ProviderDocument, ProviderProfile
+from .paginators import EstimatedCountPaginator
+
+User = get_user_model()
+
+
+class AdminTestCase(TestCase):
+    """Base class for tests that drive the admin as a logged-in superuser."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+
+    def setUp(self):
+        self.client.force_login(self.admin_user)
+        # Changelist counts are cached by EstimatedCountPaginator
+        cache.clear()
+
+    def assertConstantChangelistQueries(self, url, add_rows):
+        """Render ``url`` with one row, add more rows, and expect the same query count."""
+        add_rows(1)
+        with CaptureQueriesContext(connection) as baseline:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        add_rows(4)
+        cache.clear()
+        with self.assertNumQueries(len(baseline)):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+
+def create_provider(username, **extra_fields):
+    """Create a provider user with a ProviderProfile."""
+    user = User.objects.create_user(
+        username, f'{username}@example.com', 'password',
+        first_name='Test', last_name=username.title(), role=User.Role.PROVIDER,
+    )
+    return ProviderProfile.objects.create(user=user, service_area='Luanda', **extra_fields)
+
+
+class ProviderProfileAdminTests(AdminTestCase):
+
+    def add_providers(self, count):
+        start = ProviderProfile.objects.count()
+        for i in range(start, start + count):
+            create_provider(f'provider{i}')
+
+    def test_changelist_query_count_is_constant(self):
+        # __str__ (used for the action checkbox label) reads the user's names,
+        # which must not be deferred by list_only_fields
+        url = reverse('admin:accounts_providerprofile_changelist')
+        self.assertConstantChangelistQueries(url, self.add_providers)
+
+    def test_skills_count_treats_non_list_skills_as_empty(self):
+        profiles = [
+            create_provider('listskills', skills=['cleaning', 'ironing']),
+            create_provider('dictskills', skills={'cleaning': True}),
+            create_provider('textskills', skills='cleaning'),
+        ]
+        counts = dict(
+            ProviderProfile.objects.annotate(
+                n=Coalesce(JSONArrayLength('skills'), Value(0)),
+            ).values_list('pk', 'n')
+        )
+        self.assertEqual([counts[p.pk] for p in profiles], [2, 0, 0])
+
+        response = self.client.get(reverse('admin:accounts_providerprofile_changelist'))
+        self.assertEqual(response.status_code, 200)
+
+
+class ProviderRecordAdminTests(AdminTestCase):
+
+    def add_documents(self, count):
+        start = ProviderDocument.objects.count()
+        for i in range(start, start + count):
+            ProviderDocument.objects.create(
+                provider=create_provider(f'document{i}'),
+                document_type=ProviderDocument.DocumentType.NATIONAL_ID,
+                file='provider_documents/id.pdf',
+                file_name='id.pdf',
+            )
+
+    def add_contracts(self, count):
+        start = ProviderContract.objects.count()
+        for i in range(start, start + count):
+            ProviderContract.objects.create(
+                provider=create_provider(f'contract{i}'),
+                contract_type=ProviderContract.ContractType.SERVICE_AGREEMENT,
+                title='Service Provider Agreement',
+                version='1.0',
+                file='contracts/agreement.pdf',
+            )
+
+    def test_document_changelist_query_count_is_constant(self):
+        url = reverse('admin:accounts_providerdocument_changelist')
+        self.assertConstantChangelistQueries(url, self.add_documents)
+
+    def test_contract_changelist_query_count_is_constant(self):
+        url = reverse('admin:accounts_providercontract_changelist')
+        self.assertConstantChangelistQueries(url, self.add_contracts)
+
+
+class CreateDefaultUsersCommandTests(TestCase):
+
+    def call_command(self):
+        out = StringIO()
+        call_command('create_default_users', stdout=out)
+        return out.getvalue()
+
+    def test_creates_default_users(self):
+        self.call_command()
+        admin_user = User.objects.get(username='admin@zela.com')
+        self.assertTrue(admin_user.is_superuser)
+        self.assertTrue(admin_user.check_password('Zela123!'))
+        self.assertEqual(User.objects.get(username='provider@zela.com').role, User.Role.PROVIDER)
+
+    def test_skips_email_taken_by_another_username(self):
+        User.objects.create_user('existing-admin', 'admin@zela.com', 'password')
+
+        output = self.call_command()
+
+        self.assertIn('Superuser with email admin@zela.com already exists.', output)
+        self.assertFalse(User.objects.filter(username='admin@zela.com').exists())
+        # The other default user is still created
+        self.assertTrue(User.objects.filter(username='provider@zela.com').exists())
+
+
+class BulkRegisterTests(TestCase):
+
+    def test_hashes_passwords_and_creates_profiles(self):
+        users = User.bulk_register([
+            {'username': 'imported', 'email': 'imported@example.com', 'password': 'Secret123!'},
+            {'username': 'no-password', 'email': 'no-password@example.com'},
+        ])
+
+        imported = User.objects.get(username='imported')
+        self.assertNotEqual(imported.password, 'Secret123!')
+        self.assertTrue(imported.check_password('Secret123!'))
+        self.assertFalse(User.objects.get(username='no-password').has_usable_password())
+        self.assertEqual(Profile.objects.filter(user__in=users).count(), 2)
+
+    def test_create_test_providers_users_can_log_in(self):
+        call_command('create_test_providers', stdout=StringIO())
+        provider = User.objects.filter(role=User.Role.PROVIDER).first()
+        self.assertTrue(provider.check_password('testpass123'))
+
+
+class PaymentMethodAdminTests(AdminTestCase):
+
+    def expiry_display(self, **card_fields):
+        payment_method = PaymentMethod.objects.create(
+            user=self.admin_user, kind=PaymentMethod.Kind.CARD, provider_id=f'pm_{PaymentMethod.objects.count()}',
+            brand='visa', last4='4242', **card_fields,
+        )
+        request = RequestFactory().get('/')
+        request.user = self.admin_user
+        model_admin = PaymentMethodAdmin(PaymentMethod, admin.site)
+        return model_admin.expiry_display(model_admin.get_queryset(request).get(pk=payment_method.pk))
+
+    def test_expiry_display_pads_month_and_year(self):
+        self.assertEqual(self.expiry_display(expiry_month=11, expiry_year=2031), '11/31')
+        self.assertEqual(self.expiry_display(expiry_month=3, expiry_year=2005), '03/05')
+        self.assertEqual(self.expiry_display(expiry_month=7, expiry_year=2000), '07/00')
+
+    def test_expiry_display_without_expiry(self):
+        self.assertEqual(self.expiry_display(), '-')
+
+
+class ColumnLimitedChangeListTests(AdminTestCase):
+
+    def test_changelist_without_list_only_fields_loads_every_column(self):
+        # UserAdmin leaves list_only_fields unset
+        response = self.client.get(reverse('admin:accounts_user_changelist'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['cl'].queryset.query.deferred_loading, (frozenset(), True))
+
+
+class AdminRegistrationTests(TestCase):
+
+    def test_every_app_registers_its_admins(self):
+        # accounts registers from AccountsConfig.ready(); the other apps rely
+        # on admin autodiscovery
+        models = [
+            'accounts.User', 'accounts.ProviderProfile', 'accounts.Profile',
+            'accounts.PaymentMethod', 'accounts.Location', 'accounts.DistanceRequest',
+            'accounts.ProviderDocument', 'accounts.ProviderContract', 'accounts.UserSettings',
+            'services.ServiceCategory', 'services.ServiceTask',
+            'bookings.Booking', 'bookings.Rating',
+            'payments.Payment', 'payments.Payout', 'payments.RecentTransaction',
+            'payments.ProviderWallet', 'payments.EarningsHistory', 'payments.PayoutRequest',
+            'cms.BlogPost', 'cms.HelpArticle', 'cms.Page',
+            'notifications.Notification',
+            'pricing.PricingConfig',
+            'workers.Worker', 'workers.PropertyTypology', 'workers.ServicePackage',
+            'workers.WorkerService', 'workers.WorkerServicePricing',
+        ]
+        for label in models:
+            with self.subTest(model=label):
+                self.assertTrue(admin.site.is_registered(apps.get_model(label)))
+
+
+class EstimatedCountPaginatorTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(3):
+            User.objects.create_user(f'user{i}', f'user{i}@example.com', 'password')
+
+    def setUp(self):
+        cache.clear()
+
+    def paginator(self, queryset):
+        return EstimatedCountPaginator(queryset.order_by('pk'), 2)
+
+    def test_uses_estimate_for_large_unfiltered_tables(self):
+        threshold = EstimatedCountPaginator.estimate_threshold
+        with mock.patch.object(EstimatedCountPaginator, '_estimate', return_value=threshold) as estimate:
+            self.assertEqual(self.paginator(User.objects.all()).count, threshold)
+        estimate.assert_called_once()
+
+    def test_counts_exactly_below_threshold(self):
+        below = EstimatedCountPaginator.estimate_threshold - 1
+        with mock.patch.object(EstimatedCountPaginator, '_estimate', return_value=below):
+            self.assertEqual(self.paginator(User.objects.all()).count, 3)
+
+    def test_counts_exactly_without_estimate(self):
+        # Non-PostgreSQL backends have no estimate
+        with mock.patch.object(EstimatedCountPaginator, '_estimate', return_value=None):
+            self.assertEqual(self.paginator(User.objects.all()).count, 3)
+
+    def test_filtered_querysets_never_use_estimate(self):
+        with mock.patch.object(EstimatedCountPaginator, '_estimate', return_value=10 ** 6) as estimate:
+            count = self.paginator(User.objects.filter(username__startswith='user')).count
+        self.assertEqual(count, 3)
+        estimate.assert_not_called()
+
+    def test_exact_count_is_cached(self):
+        queryset = User.objects.filter(username__startswith='user')
+        self.assertEqual(self.paginator(queryset).count, 3)
+        User.objects.create_user('user3', 'user3@example.com', 'password')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.paginator(queryset).count, 3)
+        cache.clear()
+        self.assertEqual(self.paginator(queryset).count, 4)
+
+    def test_empty_queryset_and_lists(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(self.paginator(User.objects.none()).count, 0)
+        self.assertEqual(EstimatedCountPaginator([1, 2, 3], 2).count, 3)
+
+
+def create_location(user, name, is_main=False):
+    return Location.objects.create(
+        user=user, name=name, address_line_1='Rua 1', city='Luanda', province='Luanda', is_main=is_main,
+    )
+
+
+class LocationMainTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('resident', 'resident@example.com', 'password')
+
+    def main_locations(self, user):
+        return list(Location.objects.filter(user=user, is_main=True).values_list('name', flat=True))
+
+    def test_saving_new_main_demotes_previous_main(self):
+        home = create_location(self.user, 'Home', is_main=True)
+        create_location(self.user, 'Work', is_main=True)
+
+        self.assertEqual(self.main_locations(self.user), ['Work'])
+        home.refresh_from_db()
+        self.assertFalse(home.is_main)
+
+    def test_demotion_is_limited_to_the_same_user(self):
+        other_user = User.objects.create_user('neighbour', 'neighbour@example.com', 'password')
+        create_location(other_user, 'Neighbour home', is_main=True)
+
+        create_location(self.user, 'Home', is_main=True)
+
+        self.assertEqual(self.main_locations(other_user), ['Neighbour home'])
+
+    def test_saving_non_main_location_keeps_main(self):
+        create_location(self.user, 'Home', is_main=True)
+        work = create_location(self.user, 'Work')
+        work.name = 'Office'
+        work.save()
+
+        self.assertEqual(self.main_locations(self.user), ['Home'])
+
+    def test_promoting_loaded_location_demotes_previous_main(self):
+        create_location(self.user, 'Home', is_main=True)
+        work = Location.objects.get(pk=create_location(self.user, 'Work').pk)
+        work.is_main = True
+        work.save()
+
+        self.assertEqual(self.main_locations(self.user), ['Work'])
+
+    def test_resaving_new_main_location_keeps_it_main(self):
+        create_location(self.user, 'Home', is_main=True)
+        work = create_location(self.user, 'Work', is_main=True)
+        work.name = 'Office'
+        work.save()
+
+        self.assertEqual(self.main_locations(self.user), ['Office'])
+
+    def test_validation_allows_replacing_main_location(self):
+        # save() demotes the previous main, so full_clean() must not reject it
+        create_location(self.user, 'Home', is_main=True)
+        work = Location(
+            user=self.user, name='Work', address_line_1='Rua 2', city='Luanda', province='Luanda', is_main=True,
+        )
+        work.full_clean()
+
+    def test_database_rejects_second_main_location(self):
+        create_location(self.user, 'Home', is_main=True)
+        work = create_location(self.user, 'Work')
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Location.objects.filter(pk=work.pk).update(is_main=True)
+
+
+class SetMainLocationActionTests(AdminTestCase):
+
+    def test_one_main_location_per_selected_user(self):
+        first_user = User.objects.create_user('first', 'first@example.com', 'password')
+        second_user = User.objects.create_user('second', 'second@example.com', 'password')
+        third_user = User.objects.create_user('third', 'third@example.com', 'password')
+        create_location(first_user, 'First home', is_main=True)
+        first_work = create_location(first_user, 'First work')
+        first_gym = create_location(first_user, 'First gym')
+        create_location(second_user, 'Second home', is_main=True)
+        second_work = create_location(second_user, 'Second work')
+        create_location(third_user, 'Third home', is_main=True)
+
+        response = self.client.post(reverse('admin:accounts_location_changelist'), {
+            'action': 'set_as_main_location',
+            '_selected_action': [first_work.pk, first_gym.pk, second_work.pk],
+        })
+
+        self.assertEqual(response.status_code, 302)
+        for user in (first_user, second_user, third_user):
+            with self.subTest(user=user.username):
+                self.assertEqual(Location.objects.filter(user=user, is_main=True).count(), 1)
+        # The most recently added selection wins for a user with several selected
+        self.assertTrue(Location.objects.get(pk=first_gym.pk).is_main)
+        self.assertTrue(Location.objects.get(pk=second_work.pk).is_main)
+        # Users without a selected location keep their main location
+        self.assertTrue(Location.objects.get(user=third_user).is_main)
+
+
+class MigrationTestCase(TransactionTestCase):
+    """Migrate accounts back to ``migrate_from`` so a data migration can be run against fixtures."""
+
+    migrate_from = None
+    migrate_to = None
+
+    def setUp(self):
+        self.apps = self.migrate_accounts(self.migrate_from)
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def migrate_accounts(self, migration):
+        """Migrate accounts to ``migration`` and return the historical apps at that point."""
+        target = [('accounts', migration)]
+        executor = MigrationExecutor(connection)
+        executor.migrate(target)
+        return executor.loader.project_state(target).apps
+
+
+class ClearDuplicateDefaultsMigrationTests(MigrationTestCase):
+
+    migrate_from = '0015_providerprofile_generated_completion_rate'
+    migrate_to = '0016_paymentmethod_partial_unique_constraints'
+
+    def create_payment_method(self, user, provider_id, added_at, **fields):
+        PaymentMethod = self.apps.get_model('accounts', 'PaymentMethod')
+        payment_method = PaymentMethod.objects.create(
+            user=user, kind='card', provider_id=provider_id, is_default=True, **fields
+        )
+        PaymentMethod.objects.filter(pk=payment_method.pk).update(added_at=added_at)
+        return payment_method.pk
+
+    def test_newest_active_default_survives(self):
+        User = self.apps.get_model('accounts', 'User')
+        first_user = User.objects.create(username='first')
+        second_user = User.objects.create(username='second')
+        now = timezone.now()
+        oldest = self.create_payment_method(first_user, 'pm_1', now - timedelta(days=2))
+        newest = self.create_payment_method(first_user, 'pm_2', now)
+        older = self.create_payment_method(first_user, 'pm_3', now - timedelta(days=1))
+        inactive = self.create_payment_method(first_user, 'pm_4', now + timedelta(days=1), is_active=False)
+        only_default = self.create_payment_method(second_user, 'pm_5', now - timedelta(days=5))
+
+        migrated = self.migrate_accounts(self.migrate_to)
+
+        PaymentMethod = migrated.get_model('accounts', 'PaymentMethod')
+        defaults = set(PaymentMethod.objects.filter(is_default=True).values_list('pk', flat=True))
+        # Inactive rows are outside the constraint and keep their flag
+        self.assertEqual(defaults, {newest, inactive, only_default})
+        self.assertFalse(PaymentMethod.objects.filter(pk__in=[oldest, older], is_default=True).exists())
+
+
+class CopyProfileNamesMigrationTests(MigrationTestCase):
+
+    migrate_from = '0016_paymentmethod_partial_unique_constraints'
+    migrate_to = '0017_remove_profile_names'
+
+    def create_user(self, username, profile_names, **user_names):
+        User = self.apps.get_model('accounts', 'User')
+        Profile = self.apps.get_model('accounts', 'Profile')
+        user = User.objects.create(username=username, **user_names)
+        first_name, last_name = profile_names
+        Profile.objects.create(user=user, first_name=first_name, last_name=last_name)
+
+    def test_profile_names_fill_blank_user_names_only(self):
+        self.create_user('blank', ('Ana', 'Costa'))
+        self.create_user('named', ('Profile', 'Name'), first_name='User', last_name='Name')
+        self.create_user('partial', ('Pedro', 'Mendes'), first_name='Peter')
+        self.create_user('profile-blank', ('', ''), first_name='Maria', last_name='Silva')
+
+        migrated = self.migrate_accounts(self.migrate_to)
+
+        names = {
+            username: (first_name, last_name)
+            for username, first_name, last_name in migrated.get_model('accounts', 'User').objects.values_list(
+                'username', 'first_name', 'last_name'
+            )
+        }
+        self.assertEqual(names['blank'], ('Ana', 'Costa'))
+        # Non-empty user names are never overwritten
+        self.assertEqual(names['named'], ('User', 'Name'))
+        self.assertEqual(names['partial'], ('Peter', 'Mendes'))
+        self.assertEqual(names['profile-blank'], ('Maria', 'Silva'))
+
+
+class ClearDuplicateMainsMigrationTests(MigrationTestCase):
+
+    migrate_from = '0018_user_email_index'
+    migrate_to = '0019_location_one_main_per_user'
+
+    def create_location(self, user, name, created_at, is_main=True):
+        Location = self.apps.get_model('accounts', 'Location')
+        location = Location.objects.create(
+            user=user, name=name, address_line_1='Rua 1', city='Luanda', province='Luanda', is_main=is_main,
+        )
+        Location.objects.filter(pk=location.pk).update(created_at=created_at)
+        return location.pk
+
+    def test_newest_main_location_survives(self):
+        User = self.apps.get_model('accounts', 'User')
+        first_user = User.objects.create(username='first')
+        second_user = User.objects.create(username='second')
+        now = timezone.now()
+        oldest = self.create_location(first_user, 'Home', now - timedelta(days=2))
+        newest = self.create_location(first_user, 'Work', now)
+        older = self.create_location(first_user, 'Gym', now - timedelta(days=1))
+        self.create_location(first_user, 'Beach', now + timedelta(days=1), is_main=False)
+        only_main = self.create_location(second_user, 'Home', now - timedelta(days=5))
+
+        migrated = self.migrate_accounts(self.migrate_to)
+
+        Location = migrated.get_model('accounts', 'Location')
+        self.assertEqual(set(Location.objects.filter(is_main=True).values_list('pk', flat=True)), {newest, only_main})
+        self.assertFalse(Location.objects.filter(pk__in=[oldest, older], is_main=True).exists())
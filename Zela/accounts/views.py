@@ -13,7 +13,24 @@ from django import forms
 from .models import User, Location
 from .forms import LocationForm
 import json
-import re
+import string
+
+# Character classes a registration password must contain
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+_DIGIT = frozenset(string.digits)
+_SPECIAL = frozenset('!@#$%^&*(),.?":{}|<>')
+
+
+def _password_classes(password):
+    """Return (upper, lower, digit, special) flags from a single pass over ``password``."""
+    chars = frozenset(password)
+    return (
+        not chars.isdisjoint(_UPPER),
+        not chars.isdisjoint(_LOWER),
+        not chars.isdisjoint(_DIGIT),
+        not chars.isdisjoint(_SPECIAL),
+    )
 
 
 class RegistrationForm(forms.ModelForm):
@@ -129,20 +146,22 @@ class RegistrationForm(forms.ModelForm):
         if len(password) < 8:
             raise forms.ValidationError("Password must be at least 8 characters long.")
         
+        has_upper, has_lower, has_digit, has_special = _password_classes(password)
+        
         # Check for uppercase letter
-        if not re.search(r'[A-Z]', password):
+        if not has_upper:
             raise forms.ValidationError("Password must contain at least one uppercase letter.")
         
         # Check for lowercase letter
-        if not re.search(r'[a-z]', password):
+        if not has_lower:
             raise forms.ValidationError("Password must contain at least one lowercase letter.")
         
         # Check for digit
-        if not re.search(r'[0-9]', password):
+        if not has_digit:
             raise forms.ValidationError("Password must contain at least one number.")
         
         # Check for special character
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+        if not has_special:
             raise forms.ValidationError("Password must contain at least one special character.")
         
         return password
@@ -248,12 +267,13 @@ def validate_password_strength(request):
         password = request.POST.get('password', '')
         
         # Password strength checks
+        has_upper, has_lower, has_digit, has_special = _password_classes(password)
         checks = {
             'minLength': len(password) >= 8,
-            'hasUpper': bool(re.search(r'[A-Z]', password)),
-            'hasLower': bool(re.search(r'[a-z]', password)),
-            'hasNumber': bool(re.search(r'[0-9]', password)),
-            'hasSpecial': bool(re.search(r'[!@#$%^&*(),.?":{}|<>]', password)),
+            'hasUpper': has_upper,
+            'hasLower': has_lower,
+            'hasNumber': has_digit,
+            'hasSpecial': has_special,
         }
         
         # Calculate strength
@@ -1,7 +1,11 @@
 from django.contrib import admin
 from django.utils.html import format_html
+from accounts.changelists import ColumnLimitedChangeList
 from .models import Booking, Rating
 
+# User columns read by get_full_name() / username / email in the display columns
+_USER_FIELDS = ('username', 'email', 'first_name', 'last_name')
+
 
 @admin.register(Booking)
 class BookingAdmin(admin.ModelAdmin):
@@ -16,8 +20,15 @@ class BookingAdmin(admin.ModelAdmin):
         'customer__username', 'customer__email', 'worker__user__username', 
         'worker__user__email', 'service_task__name', 'address'
     )
-    date_hierarchy = 'start_at'
     ordering = ('-created_at',)
+    list_select_related = ('customer', 'worker__user', 'service_task__category')
+    list_only_fields = (
+        'status', 'start_at', 'total_price', 'created_at',
+        'service_task__name', 'service_task__category__name',
+        *(f'customer__{field}' for field in _USER_FIELDS),
+        *(f'worker__user__{field}' for field in _USER_FIELDS),
+    )
+    show_full_result_count = False
     
     fieldsets = (
         ('Booking Information', {
@@ -38,6 +49,9 @@ class BookingAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at', 'updated_at')
     filter_horizontal = ('extras',)
     
+    def get_changelist(self, request, **kwargs):
+        return ColumnLimitedChangeList
+    
     def customer_display(self, obj):
         """Display customer info."""
         name = obj.customer.get_full_name() or obj.customer.username
@@ -105,6 +119,12 @@ class RatingAdmin(admin.ModelAdmin):
         'comment'
     )
     ordering = ('-created',)
+    list_select_related = ('booking__customer', 'booking__worker__user', 'booking__service_task')
+    list_only_fields = (
+        'score', 'created', 'booking__service_task__name',
+        *(f'booking__customer__{field}' for field in _USER_FIELDS),
+        *(f'booking__worker__user__{field}' for field in _USER_FIELDS),
+    )
     
     fieldsets = (
         ('Rating Information', {
@@ -118,6 +138,9 @@ class RatingAdmin(admin.ModelAdmin):
     
     readonly_fields = ('created',)
     
+    def get_changelist(self, request, **kwargs):
+        return ColumnLimitedChangeList
+    
     def booking_display(self, obj):
         """Display booking info."""
         return format_html(
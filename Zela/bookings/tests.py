@@ -1,3 +1,62 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.tests import AdminTestCase
+from services.models import ServiceCategory, ServiceTask
+from workers.models import Worker
+
+from .models import Booking, Rating
+
+User = get_user_model()
+
+
+class BookingAdminTests(AdminTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        category = ServiceCategory.objects.create(name='Cleaning', slug='cleaning', icon='home')
+        cls.task = ServiceTask.objects.create(category=category, name='Deep Clean', price=15000)
+
+    def create_booking(self, suffix):
+        customer = User.objects.create_user(
+            f'customer{suffix}', f'customer{suffix}@example.com', 'password',
+            first_name='Test', last_name='Customer',
+        )
+        worker_user = User.objects.create_user(
+            f'worker{suffix}', f'worker{suffix}@example.com', 'password',
+            first_name='Test', last_name='Worker', role=User.Role.PROVIDER,
+        )
+        start_at = timezone.now() + timedelta(days=1)
+        return Booking.objects.create(
+            customer=customer,
+            worker=Worker.objects.create(user=worker_user),
+            service_task=self.task,
+            start_at=start_at,
+            end_at=start_at + timedelta(hours=2),
+            address='Rua 1, Luanda',
+            total_price=15000,
+        )
+
+    def add_bookings(self, count):
+        start = Booking.objects.count()
+        for i in range(start, start + count):
+            self.create_booking(i)
+
+    def add_ratings(self, count):
+        start = Rating.objects.count()
+        for i in range(start, start + count):
+            Rating.objects.create(booking=self.create_booking(f'rated{i}'), score=4)
+
+    def test_booking_changelist_query_count_is_constant(self):
+        # Booking.__str__ (action checkbox label) and the customer/provider
+        # columns must only read fields kept by list_only_fields
+        url = reverse('admin:bookings_booking_changelist')
+        self.assertConstantChangelistQueries(url, self.add_bookings)
+
+    def test_rating_changelist_query_count_is_constant(self):
+        url = reverse('admin:bookings_rating_changelist')
+        self.assertConstantChangelistQueries(url, self.add_ratings)
@@ -122,7 +122,7 @@ class BookingFlowMixin:
     def calculate_booking_price(self):
         """Calculate the price for the current booking."""
         from pricing.models import PricingConfig
-        from accounts.models import ProviderProfile
+        from accounts.models import DEFAULT_SERVICE_AREAS
         
         booking_data = self.get_booking_data()
         service_category = self.get_service_category()
@@ -170,7 +170,7 @@ class BookingFlowMixin:
         location_surcharge = 0
         area_name = location_data.get('area', '')
         if area_name:
-            default_areas = ProviderProfile().get_default_service_areas()
+            default_areas = DEFAULT_SERVICE_AREAS
             for area in default_areas:
                 if area['name'].lower() == area_name.lower():
                     location_surcharge = area['surcharge'] * 100
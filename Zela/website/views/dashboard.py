@@ -194,8 +194,8 @@ class DashboardShellView(LoginRequiredMixin, TemplateView):
         
         # Get profile completion percentage
         # Check both User and Profile fields
-        user_fields = ['email', 'phone']
-        profile_fields = ['first_name', 'last_name', 'profile_picture']
+        user_fields = ['email', 'phone', 'first_name', 'last_name']
+        profile_fields = ['profile_picture']
         
         completed_fields = 0
         # Check user fields
@@ -221,7 +221,7 @@ class DashboardShellView(LoginRequiredMixin, TemplateView):
         }
         
         # Get user's payment methods
-        payment_methods = user.payment_methods.filter(is_active=True).order_by('-is_default', '-added_at')
+        payment_methods = user.payment_methods.filter(is_active=True).with_display().order_by('-is_default', '-added_at')
         
         # Get user locations
         locations = user.locations.all().order_by('-is_main', '-created_at')
@@ -276,15 +276,15 @@ class DashboardShellView(LoginRequiredMixin, TemplateView):
                     status__in=['accepted', 'in_progress', 'completed', 'cancelled']
                 ).count()
                 
-                # Update provider profile statistics
+                # Update provider profile statistics (completion_rate is
+                # computed by the database from these two columns)
+                job_stats_changed = (
+                    provider_profile.jobs_completed != jobs_completed or
+                    provider_profile.jobs_total != total_accepted
+                )
                 provider_profile.jobs_completed = jobs_completed
                 provider_profile.jobs_total = total_accepted
                 
-                if total_accepted > 0:
-                    provider_profile.completion_rate = (jobs_completed / total_accepted) * 100
-                else:
-                    provider_profile.completion_rate = 0
-                
                 # Get or create provider wallet
                 wallet, created = ProviderWallet.objects.get_or_create(
                     provider=user,
@@ -379,11 +379,10 @@ class DashboardShellView(LoginRequiredMixin, TemplateView):
                 weekly_earnings = float(current_week_earnings['total_net'] or 0)
                 
                 # Only update if values have changed to avoid unnecessary DB writes
-                if (provider_profile.total_earnings != weekly_earnings or
-                    provider_profile.jobs_completed != jobs_completed or
-                    provider_profile.jobs_total != total_accepted):
+                if provider_profile.total_earnings != weekly_earnings or job_stats_changed:
                     provider_profile.total_earnings = weekly_earnings
-                    provider_profile.save(update_fields=['jobs_completed', 'jobs_total', 'completion_rate', 'total_earnings'])
+                    provider_profile.save(update_fields=['jobs_completed', 'jobs_total', 'total_earnings'])
+                    provider_profile.refresh_from_db(fields=['completion_rate'])
                 
                 # Get job lists for job queue tab
                 worker = getattr(user, 'worker_profile', None)
@@ -496,7 +495,7 @@ class DashboardShellView(LoginRequiredMixin, TemplateView):
                             if doc_type not in existing_types:
                                 missing_documents.append({
                                     'document_type': doc_type,
-                                    'display_name': dict(ProviderDocument.DOCUMENT_TYPES).get(doc_type, doc_type)
+                                    'display_name': ProviderDocument.DocumentType(doc_type).label
                                 })
                         
                         provider_context['missing_documents'] = missing_documents
@@ -774,8 +773,8 @@ class ProfileUpdateView(LoginRequiredMixin, FormView):
         
         # Set initial data from both models
         kwargs['initial'] = {
-            'first_name': profile.first_name or user.first_name,
-            'last_name': profile.last_name or user.last_name,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
             'phone': user.phone,
             'email_notifications': profile.email_notifications,
             'sms_notifications': profile.sms_notifications,
@@ -830,8 +829,8 @@ class ProfileUpdateView(LoginRequiredMixin, FormView):
         
         # Get profile completion percentage
         # Check both User and Profile fields
-        user_fields = ['email', 'phone']
-        profile_fields = ['first_name', 'last_name', 'profile_picture']
+        user_fields = ['email', 'phone', 'first_name', 'last_name']
+        profile_fields = ['profile_picture']
         
         completed_fields = 0
         # Check user fields
@@ -877,10 +876,6 @@ class ProfileUpdateView(LoginRequiredMixin, FormView):
         user = self.request.user
         profile, created = Profile.objects.get_or_create(user=user)
         
-        # Update Profile model fields
-        profile.first_name = form.cleaned_data['first_name']
-        profile.last_name = form.cleaned_data['last_name']
-        
         # Handle profile picture upload
         if 'profile_picture' in self.request.FILES:
             profile.profile_picture = self.request.FILES['profile_picture']
@@ -892,7 +887,7 @@ class ProfileUpdateView(LoginRequiredMixin, FormView):
         profile.marketing_communications = form.cleaned_data['marketing_communications']
         profile.save()
         
-        # Update User model fields to keep them in sync
+        # Update User model fields
         user.first_name = form.cleaned_data['first_name']
         user.last_name = form.cleaned_data['last_name']
         user.phone = form.cleaned_data['phone']
@@ -1166,7 +1161,7 @@ def add_payment_method(request):
                 raise ValueError("Invalid payment method type")
             
             # Get all payment methods for the user to return updated list
-            payment_methods = user.payment_methods.filter(is_active=True).order_by('-is_default', '-added_at')
+            payment_methods = user.payment_methods.filter(is_active=True).with_display().order_by('-is_default', '-added_at')
             
             # Return updated payment methods list
             return render(request, 'website/components/dashboard/tabs/wallet-payment-methods.html', {
@@ -1199,7 +1194,7 @@ def set_default_payment_method(request, pk):
         payment_method.save()
         
         # Get all payment methods for the user
-        payment_methods = request.user.payment_methods.filter(is_active=True).order_by('-is_default', '-added_at')
+        payment_methods = request.user.payment_methods.filter(is_active=True).with_display().order_by('-is_default', '-added_at')
         
         # Return updated payment methods list
         return render(request, 'website/components/dashboard/tabs/wallet-payment-methods.html', {
@@ -1423,8 +1418,6 @@ def update_profile(request):
         profile, created = Profile.objects.get_or_create(user=user)
         
         # Update profile fields
-        profile.first_name = request.POST.get('first_name', '')
-        profile.last_name = request.POST.get('last_name', '')
         profile.address = request.POST.get('address', '')
         profile.national_id_number = request.POST.get('national_id_number', '')
         
@@ -1449,7 +1442,7 @@ def update_profile(request):
         
         profile.save()
         
-        # Update user fields to keep them in sync
+        # Update user fields
         user.first_name = request.POST.get('first_name', '')
         user.last_name = request.POST.get('last_name', '')
         user.phone = request.POST.get('phone', '')
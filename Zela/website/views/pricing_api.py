@@ -2,7 +2,7 @@ from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from pricing.models import PricingConfig
-from accounts.models import ProviderProfile
+from accounts.models import DEFAULT_SERVICE_AREAS
 import json
 
 
@@ -60,7 +60,7 @@ def calculate_booking_price(request):
         
         # Get location surcharge from default service areas
         location_surcharge = 0
-        default_areas = ProviderProfile().get_default_service_areas()
+        default_areas = DEFAULT_SERVICE_AREAS
         
         for area in default_areas:
             if area['name'].lower() == area_name.lower():
@@ -128,7 +128,7 @@ def get_pricing_config(request):
         pricing_config = PricingConfig.get_instance()
         
         # Get default service areas with surcharges
-        default_areas = ProviderProfile().get_default_service_areas()
+        default_areas = DEFAULT_SERVICE_AREAS
         
         response = {
             'status': 'success',